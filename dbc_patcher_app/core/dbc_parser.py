@@ -6,17 +6,41 @@ patching operations.
 """
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field, fields, replace
+from functools import lru_cache
+from itertools import chain, repeat
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Tuple, Union
 import datetime
+import hashlib
+import inspect
+import operator
+import os
+import pickle
+import re
+import sys
+import tempfile
+import threading
+import time
 
 import cantools
 from cantools.database import Database, Message
 from cantools.database.can import Node, Signal
 
+# cantools >= 38 moved scale/offset/choices onto a ``conversion`` object.
+# Probe the constructor once so the hot paths need no per-signal getattr or
+# signature inspection.
+_SIGNAL_PARAMS = frozenset(inspect.signature(Signal.__init__).parameters)
+_HAS_CONVERSION = "conversion" in _SIGNAL_PARAMS
 
-@dataclass
+if _HAS_CONVERSION:
+    from cantools.database.conversion import BaseConversion
+
+
+@dataclass(slots=True)
 class DBCSignal:
     """Dataclass describing a DBC signal."""
 
@@ -36,10 +60,33 @@ class DBCSignal:
     multiplexer_ids: Optional[List[int]] = None
     receivers: List[str] = field(default_factory=list)
 
+    def clone(self) -> "DBCSignal":
+        """Copy this signal and its mutable containers."""
+
+        return replace(
+            self,
+            value_table=dict(self.value_table),
+            multiplexer_ids=None if self.multiplexer_ids is None else list(self.multiplexer_ids),
+            receivers=list(self.receivers),
+        )
+
+
+def _copy_attributes(attrs: Mapping[str, str]) -> Mapping[str, str]:
+    """Copy a message's attributes; shared read-only mappings are kept as-is."""
 
-@dataclass
+    return attrs if type(attrs) is MappingProxyType else dict(attrs)
+
+
+_SignalIndex = Tuple[Dict[Tuple[int, int], DBCSignal], Dict[str, DBCSignal]]
+
+
+@dataclass(slots=True)
 class DBCMessage:
-    """Dataclass describing a DBC message."""
+    """Dataclass describing a DBC message.
+
+    Messages built from a cantools ``Message`` keep it as ``source`` and only
+    normalize their signals the first time ``signals`` is read.
+    """
 
     message_id: int
     name: str
@@ -47,25 +94,314 @@ class DBCMessage:
     cycle_time: Optional[int] = None
     comment: Optional[str] = None
     is_extended_frame: bool = False
-    attributes: Dict[str, str] = field(default_factory=dict)
+    # Shared read-only mapping for loaded messages: replace it, don't mutate it.
+    attributes: Mapping[str, str] = field(default_factory=dict)
     senders: List[str] = field(default_factory=list)
     signals: List[DBCSignal] = field(default_factory=list)
+    source: Optional[Message] = field(default=None, repr=False, compare=False)
+    # (by (start_bit, length), by name) lookups over ``signals``, built lazily.
+    _signal_index: Optional[_SignalIndex] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        if self.source is not None and not self.signals:
+            # Leave ``signals`` unset so the first read goes through __getattr__.
+            del self.signals
+
+    def __getattr__(self, name: str) -> Any:
+        # Only reached for unset slots, i.e. signals that have not been
+        # normalized yet.
+        if name != "signals" or self.source is None:
+            raise AttributeError(name)
+        self.signals = _normalize_signals(self.source)
+        return self.signals
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # Pickles and copies carry normalized signals, not the cantools source.
+        state = {f.name: getattr(self, f.name) for f in fields(self)}
+        state["attributes"] = dict(self.attributes)
+        state["source"] = None
+        state["_signal_index"] = None
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        for name, value in state.items():
+            object.__setattr__(self, name, value)
+
+    def clone(self) -> "DBCMessage":
+        """Copy this message; signals that were never read stay lazy."""
+
+        try:
+            signals = object.__getattribute__(self, "signals")
+        except AttributeError:
+            return replace(
+                self,
+                attributes=_copy_attributes(self.attributes),
+                senders=list(self.senders),
+                signals=[],
+            )
+        return replace(
+            self,
+            attributes=_copy_attributes(self.attributes),
+            senders=list(self.senders),
+            signals=[sig.clone() for sig in signals],
+            source=None,
+        )
 
     @property
     def hex_id(self) -> str:
         return hex(self.message_id)
 
+    @property
+    def signals_by_key(self) -> Dict[Tuple[int, int], DBCSignal]:
+        """First signal for each ``(start_bit, length)``."""
+
+        return self._signal_indexes()[0]
+
+    @property
+    def signals_by_name(self) -> Dict[str, DBCSignal]:
+        """First signal for each name."""
+
+        return self._signal_indexes()[1]
 
-@dataclass
+    def invalidate_signal_index(self) -> None:
+        """Forget the signal lookups after ``signals`` was edited."""
+
+        self._signal_index = None
+
+    def _signal_indexes(self) -> _SignalIndex:
+        index = self._signal_index
+        if index is None:
+            by_key: Dict[Tuple[int, int], DBCSignal] = {}
+            by_name: Dict[str, DBCSignal] = {}
+            for sig in self.signals:
+                by_key.setdefault((sig.start_bit, sig.length), sig)
+                by_name.setdefault(sig.name, sig)
+            index = self._signal_index = (by_key, by_name)
+        return index
+
+
+@dataclass(slots=True)
 class DBCModel:
-    """Wrapper around a cantools Database with normalized structures."""
+    """Wrapper around a cantools Database with normalized structures.
+
+    ``db`` is materialized on demand: models restored from the on-disk cache
+    load it from ``source_path``, and models whose dataclasses were edited
+    rebuild it from their own content after ``invalidate_db``.
+    """
 
-    db: Database
-    messages: Dict[int, DBCMessage]
+    messages: Dict[int, DBCMessage]  # ordered by frame id
     version: str = ""
     nodes: List[str] = field(default_factory=list)
     source_path: Optional[Path] = None
-    loaded_at: datetime.datetime = field(default_factory=datetime.datetime.utcnow)
+    loaded_at: int = field(default_factory=time.time_ns)
+    _db: Optional[Database] = field(default=None, init=False, repr=False, compare=False)
+    _dirty: bool = field(default=False, init=False, repr=False, compare=False)
+    # Sorted sender/receiver names, used when ``nodes`` is empty. Reset
+    # together with the Database whenever the messages change.
+    _derived_nodes: Optional[Tuple[str, ...]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    @property
+    def db(self) -> Database:
+        if self._db is None:
+            if self._dirty or self.source_path is None:
+                self._db = build_database_from_model(self)
+            else:
+                self._db = cantools.database.load_file(str(self.source_path))
+            self._dirty = False
+        return self._db
+
+    @db.setter
+    def db(self, value: Database) -> None:
+        self._db = value
+        self._dirty = False
+        self._derived_nodes = None
+
+    @property
+    def loaded_at_dt(self) -> datetime.datetime:
+        """``loaded_at`` as an aware UTC datetime."""
+
+        return datetime.datetime.fromtimestamp(self.loaded_at / 1e9, tz=datetime.timezone.utc)
+
+    def prefetch_all_signals(self, parallel: Union[bool, str] = "auto") -> None:
+        """Normalize every message's signals now instead of on first access.
+
+        For callers about to walk all signals anyway. ``parallel`` is passed to
+        the prefetcher: ``"auto"`` uses threads only for large models on
+        free-threaded interpreters.
+        """
+
+        _prefetch_signals(list(self.messages.values()), parallel)
+
+    def invalidate_db(self, message_ids: Optional[Iterable[int]] = None) -> None:
+        """Mark the Database stale so it is rebuilt from the dataclasses on next access.
+
+        Args:
+            message_ids: Frame ids of the edited, added or removed messages,
+                whose signal lookups are reset. When omitted every message's
+                lookups are reset.
+        """
+
+        self._db = None
+        self._dirty = True
+        self._derived_nodes = None
+        if message_ids is None:
+            message_ids = self.messages
+        for msg_id in message_ids:
+            message = self.messages.get(msg_id)
+            if message is not None:
+                message.invalidate_signal_index()
+
+
+# Parsed models keyed by (resolved path, mtime_ns, size), least recently used
+# first. Entries are never handed out directly; callers receive a clone they are
+# free to mutate.
+_LOAD_CACHE: "OrderedDict[Tuple[str, int, int], DBCModel]" = OrderedDict()
+_LOAD_CACHE_LOCK = threading.Lock()
+
+# Bump when the pickled layout of DBCModel/DBCMessage/DBCSignal changes.
+_DISK_CACHE_SCHEMA = 3
+
+
+def _cache_enabled() -> bool:
+    return os.environ.get("DBC_PATCHER_CACHE", "1") != "0"
+
+
+def _cache_maxsize() -> int:
+    try:
+        return max(1, int(os.environ.get("DBC_PATCHER_CACHE_SIZE", "16")))
+    except ValueError:
+        return 16
+
+
+def _disk_cache_path(resolved: str) -> Optional[Path]:
+    """Return the pickle location for a DBC, or None if disk caching is off."""
+
+    cache_dir = os.environ.get("DBC_PATCHER_CACHE_DIR")
+    if not cache_dir:
+        return None
+    digest = hashlib.sha1(resolved.encode("utf-8")).hexdigest()
+    return Path(cache_dir) / f"{digest}.pkl"
+
+
+# Pickled as plain tuples rather than dataclass instances: the C pickler
+# handles builtin containers far faster than objects with __getstate__.
+_SIGNAL_FIELD_NAMES = tuple(f.name for f in fields(DBCSignal))
+_signal_field_values = operator.attrgetter(*_SIGNAL_FIELD_NAMES)
+_MESSAGE_CACHE_FIELDS = tuple(
+    f.name for f in fields(DBCMessage) if f.init and f.name not in ("signals", "source")
+)
+_message_cache_values = operator.attrgetter(*_MESSAGE_CACHE_FIELDS)
+
+
+_ATTRIBUTES_CACHE_INDEX = _MESSAGE_CACHE_FIELDS.index("attributes")
+
+
+def _message_cache_header(msg: DBCMessage) -> Tuple[Any, ...]:
+    # Shared attribute mappings are read-only proxies, which cannot be pickled.
+    header = _message_cache_values(msg)
+    i = _ATTRIBUTES_CACHE_INDEX
+    return (*header[:i], dict(header[i]), *header[i + 1 :])
+
+
+def _model_to_cache(model: DBCModel) -> Tuple[Any, ...]:
+    model.prefetch_all_signals()
+    messages = [
+        (_message_cache_header(msg), [_signal_field_values(sig) for sig in msg.signals])
+        for msg in model.messages.values()
+    ]
+    return model.version, model.nodes, model.source_path, messages
+
+
+def _model_from_cache(payload: Tuple[Any, ...]) -> DBCModel:
+    version, nodes, source_path, messages = payload
+    return DBCModel(
+        messages={
+            header[0]: DBCMessage(*header, signals=[DBCSignal(*sig) for sig in signals])
+            for header, signals in messages
+        },
+        version=version,
+        nodes=nodes,
+        source_path=source_path,
+    )
+
+
+def _read_disk_cache(cache_path: Path, key: Tuple[str, int, int]) -> Optional[DBCModel]:
+    try:
+        with cache_path.open("rb") as f:
+            header, payload = pickle.load(f)
+        if header != (key[1], key[2], _DISK_CACHE_SCHEMA):
+            return None
+        return _model_from_cache(payload)
+    except Exception:
+        return None
+
+
+def _write_disk_cache(cache_path: Path, key: Tuple[str, int, int], model: DBCModel) -> None:
+    """Atomically persist a model without its cantools Database."""
+
+    header = (key[1], key[2], _DISK_CACHE_SCHEMA)
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=cache_path.parent, suffix=".tmp")
+    except OSError:
+        return
+    try:
+        with os.fdopen(fd, "wb") as f:
+            pickle.dump((header, _model_to_cache(model)), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_name, cache_path)
+    except Exception:
+        # The cache is best effort, but never leave a partial file behind.
+        try:
+            os.unlink(tmp_name)
+        except OSError:
+            pass
+
+
+# Field order of the serialized signal/message dictionaries. The getters pull
+# every value in one C-level call instead of one attribute load per key.
+_SIGNAL_DICT_KEYS = (
+    "name",
+    "start_bit",
+    "length",
+    "byte_order",
+    "is_signed",
+    "scale",
+    "offset",
+    "minimum",
+    "maximum",
+    "unit",
+    "comment",
+    "value_table",
+    "multiplex",
+    "multiplexer_ids",
+    "receivers",
+)
+_signal_dict_values = operator.attrgetter(*_SIGNAL_DICT_KEYS)
+
+_MESSAGE_DICT_KEYS = (
+    "frame_id",
+    "name",
+    "length",
+    "is_extended_frame",
+    "cycle_time",
+    "comment",
+    "attributes",
+    "senders",
+)
+_message_dict_values = operator.attrgetter(
+    "message_id",
+    "name",
+    "length",
+    "is_extended_frame",
+    "cycle_time",
+    "comment",
+    "attributes",
+    "senders",
+)
 
 
 class DBCParser:
@@ -74,6 +410,13 @@ class DBCParser:
     def load_dbc(self, path: Path) -> DBCModel:
         """Load and normalize a DBC file.
 
+        Repeated loads of an unchanged file are served from an in-memory cache
+        keyed by path, modification time and size (bounded by
+        ``DBC_PATCHER_CACHE_SIZE``, default 16 files). When
+        ``DBC_PATCHER_CACHE_DIR`` is set, normalized models are also persisted
+        there so later sessions can skip cantools parsing. Set
+        ``DBC_PATCHER_CACHE=0`` to disable caching.
+
         Args:
             path: Path to the DBC file.
 
@@ -81,8 +424,70 @@ class DBCParser:
             DBCModel containing normalized data.
         """
 
-        db = cantools.database.load_file(str(path))
-        return self._build_model_from_db(db, Path(path))
+        if not isinstance(path, Path):
+            path = Path(path)
+        path_str = str(path)
+        if not _cache_enabled():
+            db = cantools.database.load_file(path_str)
+            return self._build_model_from_db(db, path)
+
+        st = os.stat(path_str)
+        resolved = os.path.realpath(path_str)
+        key = (resolved, st.st_mtime_ns, st.st_size)
+        with _LOAD_CACHE_LOCK:
+            cached = _LOAD_CACHE.get(key)
+            if cached is not None:
+                _LOAD_CACHE.move_to_end(key)
+        if cached is None:
+            cached = self._load_uncached(path, path_str, key)
+            with _LOAD_CACHE_LOCK:
+                for stale in [k for k in _LOAD_CACHE if k[0] == resolved]:
+                    del _LOAD_CACHE[stale]
+                _LOAD_CACHE[key] = cached
+                maxsize = _cache_maxsize()
+                while len(_LOAD_CACHE) > maxsize:
+                    _LOAD_CACHE.popitem(last=False)
+        return self._clone_model(cached)
+
+    def _load_uncached(
+        self, path: Path, path_str: str, key: Tuple[str, int, int]
+    ) -> DBCModel:
+        cache_path = _disk_cache_path(key[0])
+        if cache_path is not None:
+            model = _read_disk_cache(cache_path, key)
+            if model is not None:
+                return model
+
+        db = cantools.database.load_file(path_str)
+        model = self._build_model_from_db(db, path)
+        if cache_path is not None:
+            _write_disk_cache(cache_path, key, model)
+        return model
+
+    @staticmethod
+    def clear_cache() -> None:
+        """Drop all cached models."""
+
+        with _LOAD_CACHE_LOCK:
+            _LOAD_CACHE.clear()
+        _ATTR_FLYWEIGHT.clear()
+
+    def _clone_model(self, model: DBCModel) -> DBCModel:
+        """Copy the mutable parts of a model while sharing its Database.
+
+        Patch application replaces ``model.db`` rather than mutating it, so the
+        cantools Database can be shared between clones.
+        """
+
+        clone = replace(
+            model,
+            messages={msg_id: msg.clone() for msg_id, msg in model.messages.items()},
+            nodes=list(model.nodes),
+            loaded_at=time.time_ns(),
+        )
+        clone._db = model._db
+        clone._dirty = model._dirty
+        return clone
 
     def _build_model_from_db(
         self, db: Database, source_path: Optional[Path] = None
@@ -91,190 +496,328 @@ class DBCParser:
 
         messages: Dict[int, DBCMessage] = {}
 
-        for msg in sorted(db.messages, key=lambda m: m.frame_id):
-            signals = self._normalize_signals(msg)
-            attributes = self._extract_message_attributes(msg)
-            is_extended = bool(
-                getattr(msg, "is_extended_frame", False)
-                or getattr(msg, "is_extended", False)
-            )
-            messages[msg.frame_id] = DBCMessage(
-                message_id=msg.frame_id,
-                name=msg.name,
-                length=msg.length,
-                is_extended_frame=is_extended,
-                cycle_time=getattr(msg, "cycle_time", None),
-                comment=getattr(msg, "comment", None),
-                attributes=attributes,
-                senders=list(getattr(msg, "senders", []) or []),
-                signals=signals,
-            )
+        for msg in sorted(db.messages, key=_frame_id):
+            message = self._message_from_cantools(msg)
+            messages[message.message_id] = message
 
         version = getattr(db, "version", "") or ""
         nodes = [n.name for n in getattr(db, "nodes", []) or [] if getattr(n, "name", None)]
 
-        return DBCModel(
-            db=db,
+        model = DBCModel(
             messages=messages,
             version=version,
             nodes=nodes,
             source_path=source_path,
         )
+        model.db = db
+        return model
+
+    def _message_from_cantools(self, msg: Message) -> DBCMessage:
+        """Wrap a cantools Message; its signals are normalized on first access."""
+
+        frame_id, name, length, is_extended, cycle_time, comment, senders = _message_header(msg)
+        return DBCMessage(
+            message_id=frame_id,
+            name=sys.intern(name),
+            length=length,
+            is_extended_frame=bool(is_extended),
+            cycle_time=cycle_time,
+            comment=comment,
+            attributes=self._extract_message_attributes(msg),
+            senders=list(map(sys.intern, senders or ())),
+            source=msg,
+        )
 
     def save_dbc(self, model: DBCModel, path: Path, validate: bool = True) -> None:
-        """Persist a DBCModel to disk using cantools serialization."""
+        """Persist a DBCModel to disk using cantools serialization.
 
-        db_dict = self.model_to_dict(model)
-        dbc_text = generate_dbc_text_from_dict(db_dict, validate=validate)
-
-        Path(path).parent.mkdir(parents=True, exist_ok=True)
-        Path(path).write_text(dbc_text, encoding="utf-8")
-
-    def _normalize_signals(self, message: Message) -> List[DBCSignal]:
-        signals: List[DBCSignal] = []
-
-        def extract_conversion_attribute(obj: object, attr: str, default: Any) -> Any:
-            return getattr(obj, attr, default) if obj is not None else default
+        With ``validate`` the model is checked for out-of-range frame ids,
+        duplicate message names, names that are not DBC identifiers and
+        invalid signal lengths before anything is written.
+        """
 
-        for sig in sorted(message.signals, key=lambda s: (s.start, s.length, s.name)):
-            conversion = getattr(sig, "conversion", None)
-            scale = getattr(sig, "scale", None)
-            offset = getattr(sig, "offset", None)
-            value_table = getattr(sig, "choices", None) or {}
-            receivers = sorted(getattr(sig, "receivers", []) or [])
+        if validate:
+            # Structural checks run on the dictionary form.
+            dbc_text = generate_dbc_text_from_dict(self.model_to_dict(model), validate=True)
+        else:
+            dbc_text = generate_dbc_text_from_model(model)
 
-            if conversion is not None:
-                scale = extract_conversion_attribute(conversion, "scale", scale)
-                offset = extract_conversion_attribute(conversion, "offset", offset)
-                conv_choices = extract_conversion_attribute(conversion, "choices", None) or {}
-                if conv_choices:
-                    value_table = conv_choices
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        _write_text(path, dbc_text)
 
-            multiplex = None
-            is_multiplexer = getattr(sig, "is_multiplexer", False)
-            multiplexer_ids = getattr(sig, "multiplexer_ids", None)
-            if is_multiplexer:
-                multiplex = "MUX"
-            elif multiplexer_ids:
-                multiplex = "SUB"
-
-            signals.append(
-                DBCSignal(
-                    name=sig.name,
-                    start_bit=sig.start,
-                    length=sig.length,
-                    byte_order="motorola" if sig.byte_order == "big_endian" else "intel",
-                    is_signed=sig.is_signed,
-                    scale=scale if scale is not None else 1.0,
-                    offset=offset if offset is not None else 0.0,
-                    minimum=getattr(sig, "minimum", None),
-                    maximum=getattr(sig, "maximum", None),
-                    unit=getattr(sig, "unit", None),
-                    comment=getattr(sig, "comment", None),
-                    value_table={str(k): str(v) for k, v in value_table.items()},
-                    multiplex=multiplex,
-                    multiplexer_ids=multiplexer_ids if multiplexer_ids else None,
-                    receivers=receivers,
-                )
-            )
-        return signals
+    def _normalize_signals(self, message: Message) -> List[DBCSignal]:
+        return _normalize_signals(message)
 
-    def update_database_from_model(self, model: DBCModel) -> None:
-        """Rebuild the underlying cantools Database from dataclass content."""
+    def update_database_from_model(
+        self, model: DBCModel, message_ids: Optional[Iterable[int]] = None
+    ) -> None:
+        """Sync the underlying cantools Database with edited dataclass content.
 
-        db_dict = self.model_to_dict(model)
-        new_db = build_database_from_dict(db_dict)
-        refreshed_db = cantools.database.load_string(new_db.as_dbc_string())
-        refreshed = self._build_model_from_db(refreshed_db, model.source_path)
+        The dataclasses are authoritative, so the Database is only marked stale
+        here and rebuilt lazily the next time ``model.db`` is accessed. Pass
+        ``message_ids`` to limit which messages' signal lookups are reset.
+        """
 
-        model.db = refreshed.db
-        model.messages = refreshed.messages
-        model.version = refreshed.version
-        model.nodes = refreshed.nodes
-        model.loaded_at = refreshed.loaded_at
+        model.invalidate_db(message_ids)
 
-    def _extract_message_attributes(self, msg: Message) -> Dict[str, str]:
+    def _extract_message_attributes(self, msg: Message) -> Mapping[str, str]:
         """Fetch message attributes defensively across cantools versions."""
 
-        def get_attributes_from_specifics(specifics: object) -> Dict[str, object]:
-            if specifics is None:
-                return {}
-            if hasattr(specifics, "attributes"):
-                return getattr(specifics, "attributes") or {}
-            if hasattr(specifics, "attribute_values"):
-                return getattr(specifics, "attribute_values") or {}
-            return {}
-
-        raw_attrs: Dict[str, object]
-        if hasattr(msg, "attributes"):
-            raw_attrs = getattr(msg, "attributes") or {}
-        elif hasattr(msg, "dbc_specifics"):
-            raw_attrs = get_attributes_from_specifics(getattr(msg, "dbc_specifics"))
-        elif hasattr(msg, "_dbc_specifics"):
-            raw_attrs = get_attributes_from_specifics(getattr(msg, "_dbc_specifics"))
-        else:
-            raw_attrs = {}
-
-        return {str(k): str(v) for k, v in raw_attrs.items()}
+        # ``attributes`` is set per instance on messages built from a model or
+        # dict, so it is checked on every message; only the specifics accessor
+        # is fixed per class.
+        raw_attrs = getattr(msg, "attributes", None)
+        if raw_attrs is None:
+            msg_type = type(msg)
+            fetch = _ATTR_FETCHERS.get(msg_type)
+            if fetch is None:
+                fetch = _ATTR_FETCHERS[msg_type] = _probe_attribute_fetcher(msg)
+            raw_attrs = fetch(msg)
+        return _shared_attributes(_str_dict(raw_attrs) if raw_attrs else {})
 
     def _signal_to_dict(self, signal: DBCSignal) -> Dict[str, object]:
         """Convert a DBCSignal into a serializable dictionary."""
 
-        return {
-            "name": signal.name,
-            "start_bit": signal.start_bit,
-            "length": signal.length,
-            "byte_order": signal.byte_order,
-            "is_signed": signal.is_signed,
-            "scale": signal.scale,
-            "offset": signal.offset,
-            "minimum": signal.minimum,
-            "maximum": signal.maximum,
-            "unit": signal.unit,
-            "comment": signal.comment,
-            "value_table": signal.value_table,
-            "multiplex": signal.multiplex,
-            "multiplexer_ids": signal.multiplexer_ids,
-            "receivers": signal.receivers,
-        }
+        return dict(zip(_SIGNAL_DICT_KEYS, _signal_dict_values(signal)))
 
     def _message_to_dict(self, message: DBCMessage) -> Dict[str, object]:
         """Convert a DBCMessage into a serializable dictionary."""
 
-        return {
-            "frame_id": message.message_id,
-            "name": message.name,
-            "length": message.length,
-            "is_extended_frame": message.is_extended_frame,
-            "cycle_time": message.cycle_time,
-            "comment": message.comment,
-            "attributes": message.attributes,
-            "senders": message.senders,
-            "signals": [self._signal_to_dict(sig) for sig in message.signals],
-        }
+        data = dict(zip(_MESSAGE_DICT_KEYS, _message_dict_values(message)))
+        data["attributes"] = dict(message.attributes)
+        data["signals"] = [self._signal_to_dict(sig) for sig in message.signals]
+        return data
 
     def model_to_dict(self, model: DBCModel) -> Dict[str, object]:
         """Export a dataclass model into a dictionary representation."""
 
-        nodes = list(model.nodes)
-        if not nodes:
-            node_set = set()
-            for msg in model.messages.values():
-                node_set.update(msg.senders)
-                for sig in msg.signals:
-                    node_set.update(sig.receivers)
-            nodes = sorted(node_set)
+        # ``model.messages`` is built in frame-id order and kept that way by
+        # every insertion, so no re-sort is needed here.
+        model.prefetch_all_signals()
+        messages = list(model.messages.values())
 
         return {
             "version": model.version,
-            "nodes": nodes,
-            "messages": [
-                self._message_to_dict(msg)
-                for msg in sorted(model.messages.values(), key=lambda m: m.message_id)
-            ],
+            "nodes": _model_nodes(model, messages),
+            "messages": [self._message_to_dict(msg) for msg in messages],
         }
 
 
+def _model_nodes(model: DBCModel, messages: List[DBCMessage]) -> List[str]:
+    """Return the model's nodes, deriving them from senders/receivers if unset."""
+
+    nodes = list(model.nodes)
+    if not nodes:
+        derived = model._derived_nodes
+        if derived is None:
+            node_set = set(chain.from_iterable(msg.senders for msg in messages))
+            node_set.update(
+                chain.from_iterable(sig.receivers for msg in messages for sig in msg.signals)
+            )
+            derived = model._derived_nodes = tuple(sorted(node_set))
+        nodes = list(derived)
+    return nodes
+
+
+_frame_id = operator.attrgetter("frame_id")
+_message_header_fields = operator.attrgetter(
+    "frame_id", "name", "length", "is_extended_frame", "cycle_time", "comment", "senders"
+)
+
+
+def _message_header(msg: Message) -> Tuple[Any, ...]:
+    """Read the scalar message fields in one call, tolerating older cantools."""
+
+    try:
+        return _message_header_fields(msg)
+    except AttributeError:
+        return (
+            msg.frame_id,
+            msg.name,
+            msg.length,
+            getattr(msg, "is_extended_frame", False) or getattr(msg, "is_extended", False),
+            getattr(msg, "cycle_time", None),
+            getattr(msg, "comment", None),
+            getattr(msg, "senders", None),
+        )
+
+
+# DBC-specifics attribute accessor per cantools Message class, probed on the
+# first instance without an ``attributes`` attribute.
+_ATTR_FETCHERS: Dict[type, Callable[[Message], Dict[str, object]]] = {}
+
+# Messages with identical attribute sets share one read-only mapping. The
+# table is emptied when it reaches _ATTR_FLYWEIGHT_SIZE entries and by
+# DBCParser.clear_cache; messages keep the mappings they already hold.
+_ATTR_FLYWEIGHT: Dict[frozenset, Mapping[str, str]] = {}
+_ATTR_FLYWEIGHT_SIZE = 4096
+
+
+def _shared_attributes(attrs: Dict[str, str]) -> Mapping[str, str]:
+    key = frozenset(attrs.items())
+    shared = _ATTR_FLYWEIGHT.get(key)
+    if shared is None:
+        if len(_ATTR_FLYWEIGHT) >= _ATTR_FLYWEIGHT_SIZE:
+            _ATTR_FLYWEIGHT.clear()
+        shared = _ATTR_FLYWEIGHT[key] = MappingProxyType(attrs)
+    return shared
+
+
+def _attributes_from_specifics(specifics: object) -> Dict[str, object]:
+    if specifics is None:
+        return {}
+    if hasattr(specifics, "attributes"):
+        return getattr(specifics, "attributes") or {}
+    if hasattr(specifics, "attribute_values"):
+        return getattr(specifics, "attribute_values") or {}
+    return {}
+
+
+def _no_attributes(msg: Message) -> Dict[str, object]:
+    return {}
+
+
+def _probe_attribute_fetcher(msg: Message) -> Callable[[Message], Dict[str, object]]:
+    for name in ("dbc_specifics", "_dbc_specifics"):
+        if hasattr(msg, name):
+            getter = operator.attrgetter(name)
+            return lambda m: _attributes_from_specifics(getter(m))
+    return _no_attributes
+
+
+if _HAS_CONVERSION:
+
+    def _signal_conversion(sig: Signal) -> Tuple[Any, Any, Any]:
+        conversion = sig.conversion
+        return conversion.scale, conversion.offset, conversion.choices
+
+else:
+
+    def _signal_conversion(sig: Signal) -> Tuple[Any, Any, Any]:
+        return sig.scale, sig.offset, sig.choices
+
+
+def _str_dict(values: Dict[Any, Any]) -> Dict[str, str]:
+    """Coerce the keys and values of a mapping to str."""
+
+    # Copy as-is when everything is already str; the first item rules out the
+    # common int-keyed cantools choices without scanning the whole mapping.
+    first = next(iter(values.items()), None)
+    if first is not None and type(first[0]) is str and type(first[1]) is str:
+        if all(type(k) is str and type(v) is str for k, v in values.items()):
+            return dict(values)
+    return dict(zip(map(str, values), map(str, values.values())))
+
+
+# Unit, receiver and sender names repeat across thousands of signals, and
+# signal/message names repeat across the models being diffed; interning them
+# shares one object per distinct string and lets comparisons hit identity first.
+_MOTOROLA = sys.intern("motorola")
+_INTEL = sys.intern("intel")
+
+_SIG_SORT_KEY = operator.attrgetter("start", "length", "name")
+_SIG_FIELDS = operator.attrgetter(
+    "name",
+    "start",
+    "length",
+    "byte_order",
+    "is_signed",
+    "minimum",
+    "maximum",
+    "unit",
+    "comment",
+    "is_multiplexer",
+    "multiplexer_ids",
+    "receivers",
+)
+
+
+def _normalize_signals(message: Message) -> List[DBCSignal]:
+    """Convert the signals of a cantools Message into DBCSignal dataclasses."""
+
+    signals: List[DBCSignal] = []
+    append = signals.append
+    intern = sys.intern
+
+    for sig in sorted(message.signals, key=_SIG_SORT_KEY):
+        (
+            name,
+            start,
+            length,
+            byte_order,
+            is_signed,
+            minimum,
+            maximum,
+            unit,
+            comment,
+            is_multiplexer,
+            multiplexer_ids,
+            receivers,
+        ) = _SIG_FIELDS(sig)
+        scale, offset, choices = _signal_conversion(sig)
+        if is_multiplexer:
+            multiplex: Optional[str] = "MUX"
+        elif multiplexer_ids:
+            multiplex = "SUB"
+        else:
+            multiplex = None
+
+        append(
+            DBCSignal(
+                name=intern(name),
+                start_bit=start,
+                length=length,
+                byte_order=_MOTOROLA if byte_order == "big_endian" else _INTEL,
+                is_signed=is_signed,
+                scale=scale if scale is not None else 1.0,
+                offset=offset if offset is not None else 0.0,
+                minimum=minimum,
+                maximum=maximum,
+                unit=intern(unit) if unit else unit,
+                comment=comment,
+                value_table=_str_dict(choices) if choices else {},
+                multiplex=multiplex,
+                multiplexer_ids=multiplexer_ids if multiplexer_ids else None,
+                receivers=sorted(map(intern, receivers or ())),
+            )
+        )
+    return signals
+
+
+# Below this many messages a thread pool costs more than it saves.
+_PARALLEL_NORMALIZE_MIN = 500
+
+
+def _gil_disabled() -> bool:
+    is_gil_enabled = getattr(sys, "_is_gil_enabled", None)
+    return is_gil_enabled is not None and not is_gil_enabled()
+
+
+def _load_signals(message: DBCMessage) -> List[DBCSignal]:
+    return message.signals
+
+
+def _prefetch_signals(messages: List[DBCMessage], parallel: Union[bool, str] = "auto") -> None:
+    """Normalize the signals of every message up front.
+
+    Messages normalize independently, so with ``parallel="auto"`` large batches
+    are spread over a thread pool on free-threaded interpreters. With the GIL
+    enabled threads would only add overhead and the work stays sequential.
+    ``True``/``False`` force either mode.
+    """
+
+    if parallel == "auto":
+        parallel = len(messages) >= _PARALLEL_NORMALIZE_MIN and _gil_disabled()
+    if parallel:
+        with ThreadPoolExecutor() as pool:
+            for _ in pool.map(_load_signals, messages):
+                pass
+    else:
+        for message in messages:
+            _load_signals(message)
+
+
 def export_message_to_dict(message: Message) -> Dict[str, object]:
     """Convert a cantools Message into a plain dictionary."""
 
@@ -308,100 +851,237 @@ def export_db_to_dict(database: Database) -> Dict[str, object]:
     return parser.model_to_dict(model)
 
 
+# Characters encoded per write; bounds the extra memory of a save to one chunk
+# instead of a full UTF-8 copy of the file.
+_WRITE_CHUNK = 1 << 20
+
+
+def _write_text(path: Path, text: str) -> None:
+    """Write ``text`` as UTF-8 to ``path`` through a raw descriptor, chunk by chunk."""
+
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        for start in range(0, len(text), _WRITE_CHUNK):
+            view = memoryview(text[start:start + _WRITE_CHUNK].encode("utf-8"))
+            while view:
+                view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+
 def generate_dbc_text_from_dict(db_dict: Dict[str, object], validate: bool = True) -> str:
     """Construct a DBC string from a dictionary representation."""
 
-    db = build_database_from_dict(db_dict)
-    dbc_text = db.as_dbc_string()
     if validate:
-        cantools.database.load_string(dbc_text)
-    return dbc_text
+        _validate_db_dict(db_dict)
+    db = build_database_from_dict(db_dict)
+    return db.as_dbc_string()
 
 
-def _build_signal_from_dict(data: Dict[str, object]) -> Signal:
-    receivers = list(data.get("receivers", []) or [])
-    byte_order = "big_endian" if data.get("byte_order") == "motorola" else "little_endian"
-    choices: Dict[object, str] = {}
-    for raw_key, raw_value in (data.get("value_table") or {}).items():
-        try:
-            key: object = int(raw_key)
-        except Exception:
-            key = str(raw_key)
-        choices[key] = str(raw_value)
-
-    minimum = data.get("minimum")
-    maximum = data.get("maximum")
-    multiplex_field = data.get("multiplex")
-    is_multiplexer = multiplex_field == "MUX"
-    multiplexer_ids_raw = data.get("multiplexer_ids") or []
+def generate_dbc_text_from_model(model: DBCModel) -> str:
+    """Construct a DBC string directly from a DBCModel."""
+
+    return build_database_from_model(model).as_dbc_string()
+
+
+# Message and signal names must be C identifiers to parse back from DBC text.
+_DBC_NAME = re.compile(r"[A-Za-z_][A-Za-z0-9_]*")
+
+
+def _validate_db_dict(db_dict: Dict[str, object]) -> None:
+    """Cheap structural checks on a database dict, raising ``ValueError`` on failure.
+
+    Overlapping signals and signals that do not fit their message are
+    rejected by cantools when the Database is built.
+    """
+
+    seen_names = set()
+    for msg in db_dict.get("messages", []):  # type: ignore[union-attr]
+        name = msg["name"]
+        if not _DBC_NAME.fullmatch(str(name)):
+            raise ValueError(f"Message {name!r}: not a valid DBC name")
+        frame_id = int(msg["frame_id"])
+        limit = 0x1FFFFFFF if msg.get("is_extended_frame") else 0x7FF
+        if not 0 <= frame_id <= limit:
+            raise ValueError(f"Message {name}: frame id {hex(frame_id)} out of range")
+        if name in seen_names:
+            raise ValueError(f"Duplicate message name {name}")
+        seen_names.add(name)
+        for sig in msg.get("signals", []):
+            if not _DBC_NAME.fullmatch(str(sig["name"])):
+                raise ValueError(f"Signal {name}.{sig['name']!r}: not a valid DBC name")
+            if not 1 <= int(sig["length"]) <= 64:
+                raise ValueError(f"Signal {name}.{sig['name']}: invalid length {sig['length']}")
+
+
+def _as_int(value: object) -> Optional[int]:
+    """Return ``value`` as an int when it is integral, else None, without raising."""
+
+    if isinstance(value, int):
+        return value
+    if isinstance(value, float):
+        return int(value) if value.is_integer() else None
+    text = str(value)
+    digits = text[1:] if text[:1] == "-" else text
+    return int(text) if digits.isdecimal() else None
+
+
+@lru_cache(maxsize=4096)
+def _choice_key(raw_key: object) -> object:
+    """Return a value-table key as int when numeric, otherwise as str."""
+
+    key = _as_int(raw_key)
+    return str(raw_key) if key is None else key
+
+
+def _choices_from_table(table: Dict[Any, Any]) -> Dict[object, str]:
+    return dict(zip(map(_choice_key, table), map(str, table.values())))
+
+
+def _multiplexer_ids(multiplex_field: object, multiplexer_ids_raw: object) -> Optional[List[int]]:
+    """Resolve cantools multiplexer ids from the normalized multiplex fields."""
+
     multiplexer_ids = [int(mid) for mid in multiplexer_ids_raw] if multiplexer_ids_raw else None
+    if multiplex_field not in (None, "", "MUX") and not multiplexer_ids:
+        mux_id = _as_int(multiplex_field)
+        multiplexer_ids = [mux_id] if mux_id is not None else None
+    return multiplexer_ids
 
-    if not is_multiplexer and multiplex_field not in (None, "", "MUX") and not multiplexer_ids:
-        try:
-            multiplexer_ids = [int(multiplex_field)]
-        except Exception:
-            multiplexer_ids = None
+
+def _conversion_kwargs(
+    scale: float, offset: float, choices: Dict[object, str], is_float: bool
+) -> Dict[str, object]:
+    if _HAS_CONVERSION:
+        return {
+            "conversion": BaseConversion.factory(
+                scale=scale, offset=offset, choices=choices or None, is_float=is_float
+            )
+        }
+    return {"scale": scale, "offset": offset, "choices": choices or None, "is_float": is_float}
+
+
+def _signal_from_dict(data: Dict[str, object]) -> Tuple[DBCSignal, bool]:
+    """Read a signal dictionary into a DBCSignal and its ``is_float`` flag.
+
+    A cantools ``conversion`` (or ``decimal``) object in the dictionary takes
+    precedence over the plain scale, offset and value table.
+    """
 
     scale = float(data.get("scale", 1.0))
     offset = float(data.get("offset", 0.0))
     is_float = bool(data.get("is_float", False))
+    value_table = data.get("value_table") or {}
     conversion = data.get("conversion") or data.get("decimal")
     if conversion is not None:
         scale = float(getattr(conversion, "scale", scale))
         offset = float(getattr(conversion, "offset", offset))
         is_float = bool(getattr(conversion, "is_float", is_float))
-        conv_choices = getattr(conversion, "choices", None)
-        if conv_choices:
-            normalized_choices: Dict[object, str] = {}
-            for raw_key, raw_value in conv_choices.items():
-                try:
-                    norm_key: object = int(raw_key)
-                except Exception:
-                    norm_key = str(raw_key)
-                normalized_choices[norm_key] = str(raw_value)
-            choices = normalized_choices
-
-    signal = Signal(
+        value_table = getattr(conversion, "choices", None) or value_table
+
+    signal = DBCSignal(
         name=str(data.get("name", "")),
-        start=int(data.get("start_bit", 0)),
+        start_bit=int(data.get("start_bit", 0)),
         length=int(data.get("length", 1)),
-        byte_order=byte_order,
+        byte_order=str(data.get("byte_order", "intel")),
         is_signed=bool(data.get("is_signed", False)),
         scale=scale,
         offset=offset,
-        minimum=float(minimum) if minimum is not None else None,
-        maximum=float(maximum) if maximum is not None else None,
+        minimum=data.get("minimum"),
+        maximum=data.get("maximum"),
         unit=data.get("unit"),
-        choices=choices or None,
         comment=data.get("comment"),
-        receivers=receivers,
-        is_multiplexer=is_multiplexer,
+        value_table=value_table,
+        multiplex=data.get("multiplex"),
+        multiplexer_ids=data.get("multiplexer_ids"),
+        receivers=list(data.get("receivers", []) or []),
+    )
+    return signal, is_float
+
+
+def _build_signal_from_model(
+    sig: DBCSignal, mux_signal: Optional[str] = None, is_float: bool = False
+) -> Signal:
+    """Build a cantools Signal from a DBCSignal.
+
+    ``mux_signal`` names the multiplexer of the signal's message; it is only
+    attached to multiplexed signals.
+    """
+
+    minimum = sig.minimum
+    maximum = sig.maximum
+    multiplex_field = sig.multiplex
+    multiplexer_ids = _multiplexer_ids(multiplex_field, sig.multiplexer_ids)
+    choices = _choices_from_table(sig.value_table or {})
+    return Signal(
+        name=str(sig.name),
+        start=int(sig.start_bit),
+        length=int(sig.length),
+        byte_order="big_endian" if sig.byte_order == "motorola" else "little_endian",
+        is_signed=bool(sig.is_signed),
+        minimum=float(minimum) if minimum is not None else None,
+        maximum=float(maximum) if maximum is not None else None,
+        unit=sig.unit,
+        comment=sig.comment,
+        receivers=list(sig.receivers or []),
+        is_multiplexer=multiplex_field == "MUX",
         multiplexer_ids=multiplexer_ids,
-        multiplexer_signal=data.get("multiplexer_signal"),
-        is_float=is_float,
+        multiplexer_signal=mux_signal if multiplexer_ids else None,
+        **_conversion_kwargs(float(sig.scale), float(sig.offset), choices, is_float),
     )
 
-    return signal
-
 
 def _build_message_from_dict(data: Dict[str, object]) -> Message:
-    signals = [_build_signal_from_dict(sig) for sig in data.get("signals", []) or []]
-    senders = list(data.get("senders", []) or [])
-
-    message = Message(
-        frame_id=int(data.get("frame_id", 0)),
+    signals: List[DBCSignal] = []
+    options: List[Tuple[bool, Optional[str]]] = []
+    for sig_data in data.get("signals", []) or []:
+        signal, is_float = _signal_from_dict(sig_data)
+        signals.append(signal)
+        options.append((is_float, sig_data.get("multiplexer_signal")))
+
+    message = DBCMessage(
+        message_id=int(data.get("frame_id", 0)),
         name=str(data.get("name", f"MSG_{data.get('frame_id', 0)}")),
         length=int(data.get("length", 8)),
-        signals=signals,
-        senders=senders or None,
         cycle_time=data.get("cycle_time"),
-        is_extended_frame=bool(data.get("is_extended_frame", False)),
         comment=data.get("comment"),
+        is_extended_frame=bool(data.get("is_extended_frame", False)),
+        attributes={str(k): v for k, v in (data.get("attributes") or {}).items()},
+        senders=list(data.get("senders", []) or []),
+        signals=signals,
     )
+    return _build_message_from_model(message, options)
 
-    attributes = data.get("attributes") or {}
-    if attributes:
-        setattr(message, "attributes", {str(k): v for k, v in attributes.items()})
+
+def _build_message_from_model(
+    msg: DBCMessage, signal_options: Iterable[Tuple[bool, Optional[str]]] = ()
+) -> Message:
+    """Build a cantools Message from a DBCMessage.
+
+    Multiplexed signals are tied to the message's MUX signal.
+    ``signal_options`` holds the per-signal ``(is_float, multiplexer_signal)``
+    pairs that only dictionary input carries; by default they are
+    ``(False, None)``.
+    """
+
+    signals = msg.signals
+    mux_name = next((sig.name for sig in signals if sig.multiplex == "MUX"), None)
+    options = chain(signal_options, repeat((False, None)))
+    message = Message(
+        frame_id=int(msg.message_id),
+        name=str(msg.name),
+        length=int(msg.length),
+        signals=[
+            _build_signal_from_model(sig, mux_signal or mux_name, is_float)
+            for sig, (is_float, mux_signal) in zip(signals, options)
+        ],
+        senders=list(msg.senders) or None,
+        cycle_time=msg.cycle_time,
+        is_extended_frame=bool(msg.is_extended_frame),
+        comment=msg.comment,
+    )
+
+    if msg.attributes:
+        setattr(message, "attributes", dict(msg.attributes))
 
     return message
 
@@ -415,7 +1095,21 @@ def build_database_from_dict(db_dict: Dict[str, object]) -> Database:
         messages=messages,
         nodes=nodes,
         version=version,
-        attributes=None,
     )
     return database
 
+
+def build_database_from_model(model: DBCModel) -> Database:
+    """Build a cantools Database from a DBCModel's dataclasses.
+
+    Equivalent to ``build_database_from_dict(DBCParser().model_to_dict(model))``
+    without materializing the intermediate dictionaries.
+    """
+
+    model.prefetch_all_signals()
+    messages = list(model.messages.values())
+    return cantools.database.Database(
+        messages=[_build_message_from_model(msg) for msg in messages],
+        nodes=[Node(name=str(node)) for node in _model_nodes(model, messages)],
+        version=str(model.version) if model.version is not None else "",
+    )
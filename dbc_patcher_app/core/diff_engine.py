@@ -2,13 +2,33 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from datetime import datetime
+from operator import attrgetter
 from typing import Dict, List, Optional, Tuple
 
 from .dbc_parser import DBCModel, DBCMessage, DBCSignal, DBCParser
-
-
-@dataclass
+from .utils import utc_now_iso
+
+
+_SIGNAL_DIFF_FIELDS = (
+    "name",
+    "start_bit",
+    "length",
+    "byte_order",
+    "is_signed",
+    "scale",
+    "offset",
+    "minimum",
+    "maximum",
+    "unit",
+    "comment",
+    "value_table",
+    "receivers",
+)
+# Snapshot of all compared fields as one tuple, so equal signals cost one compare.
+_signal_diff_values = attrgetter(*_SIGNAL_DIFF_FIELDS)
+
+
+@dataclass(slots=True)
 class DiffRule:
     op: str
     message_id: str
@@ -68,7 +88,7 @@ class DiffEngine:
 
         return {
             "version": 1,
-            "created": datetime.utcnow().isoformat(),
+            "created": utc_now_iso(),
             "rules": [r.to_dict() for r in rules],
         }
 
@@ -79,19 +99,21 @@ class DiffEngine:
 
     def _compare_message(self, raw_msg: DBCMessage, clean_msg: DBCMessage) -> List[DiffRule]:
         rules: List[DiffRule] = []
+        hex_id = clean_msg.hex_id
 
         raw_signals = {s.name: s for s in raw_msg.signals}
         clean_signals = {s.name: s for s in clean_msg.signals}
 
-        raw_names = set(raw_signals.keys())
-        clean_names = set(clean_signals.keys())
+        # dict key views support set algebra without building extra sets.
+        raw_names = raw_signals.keys()
+        clean_names = clean_signals.keys()
 
         for sig in clean_names - raw_names:
             clean_signal = clean_signals[sig]
             rules.append(
                 DiffRule(
                     op="add_signal",
-                    message_id=clean_msg.hex_id,
+                    message_id=hex_id,
                     signal_name=sig,
                     signal=self.parser._signal_to_dict(clean_signal),
                 )
@@ -101,23 +123,26 @@ class DiffEngine:
             rules.append(
                 DiffRule(
                     op="remove_signal",
-                    message_id=clean_msg.hex_id,
+                    message_id=hex_id,
                     signal_name=sig,
                 )
             )
 
-        if raw_msg.senders != clean_msg.senders:
+        raw_senders = raw_msg.senders
+        clean_senders = clean_msg.senders
+        # Sender order carries no meaning in a DBC; ignore reorder-only changes.
+        if raw_senders != clean_senders and sorted(raw_senders) != sorted(clean_senders):
             rules.append(
                 DiffRule(
                     op="update_message_senders",
-                    message_id=clean_msg.hex_id,
-                    changes={"senders": {"from": raw_msg.senders, "to": clean_msg.senders}},
+                    message_id=hex_id,
+                    changes={"senders": {"from": raw_senders, "to": clean_senders}},
                 )
             )
 
         for name in raw_names & clean_names:
             rules.extend(
-                self._compare_signal(raw_msg, raw_signals[name], clean_signals[name])
+                self._compare_signal(hex_id, raw_signals[name], clean_signals[name])
             )
 
         renamed = self._detect_renames(raw_msg.signals, clean_msg.signals)
@@ -125,7 +150,7 @@ class DiffEngine:
             rules.append(
                 DiffRule(
                     op="rename_signal",
-                    message_id=clean_msg.hex_id,
+                    message_id=hex_id,
                     signal_match={"start_bit": old.start_bit, "length": old.length},
                     signal_name=new.name,
                 )
@@ -134,30 +159,20 @@ class DiffEngine:
         return rules
 
     def _compare_signal(
-        self, message: DBCMessage, raw_sig: DBCSignal, clean_sig: DBCSignal
+        self, hex_id: str, raw_sig: DBCSignal, clean_sig: DBCSignal
     ) -> List[DiffRule]:
-        changes: Dict[str, Dict[str, object]] = {}
-        fields = [
-            "name",
-            "start_bit",
-            "length",
-            "byte_order",
-            "is_signed",
-            "scale",
-            "offset",
-            "minimum",
-            "maximum",
-            "unit",
-            "comment",
-            "value_table",
-            "receivers",
-        ]
+        if raw_sig is clean_sig:
+            return []
+        raw_vals = _signal_diff_values(raw_sig)
+        clean_vals = _signal_diff_values(clean_sig)
+        if raw_vals == clean_vals:
+            return []
 
-        for field in fields:
-            raw_val = getattr(raw_sig, field)
-            clean_val = getattr(clean_sig, field)
-            if raw_val != clean_val:
-                changes[field] = {"from": raw_val, "to": clean_val}
+        changes: Dict[str, Dict[str, object]] = {
+            field: {"from": raw_val, "to": clean_val}
+            for field, raw_val, clean_val in zip(_SIGNAL_DIFF_FIELDS, raw_vals, clean_vals)
+            if raw_val != clean_val
+        }
 
         if not changes:
             return []
@@ -165,7 +180,7 @@ class DiffEngine:
         return [
             DiffRule(
                 op="update_signal",
-                message_id=message.hex_id,
+                message_id=hex_id,
                 signal_match={"start_bit": raw_sig.start_bit, "length": raw_sig.length},
                 changes=changes,
             )
@@ -174,16 +189,19 @@ class DiffEngine:
     def _detect_renames(
         self, raw_signals: List[DBCSignal], clean_signals: List[DBCSignal]
     ) -> List[Tuple[DBCSignal, DBCSignal]]:
+        # Index clean signals by layout; several may share one (multiplexing).
+        clean_by_layout: Dict[Tuple[int, int, str], List[DBCSignal]] = {}
+        for clean_sig in clean_signals:
+            key = (clean_sig.start_bit, clean_sig.length, clean_sig.byte_order)
+            clean_by_layout.setdefault(key, []).append(clean_sig)
+
         matches: List[Tuple[DBCSignal, DBCSignal]] = []
         for raw_sig in raw_signals:
-            for clean_sig in clean_signals:
-                if raw_sig.name == clean_sig.name:
-                    continue
-                if (
-                    raw_sig.start_bit == clean_sig.start_bit
-                    and raw_sig.length == clean_sig.length
-                    and raw_sig.byte_order == clean_sig.byte_order
-                ):
+            candidates = clean_by_layout.get((raw_sig.start_bit, raw_sig.length, raw_sig.byte_order))
+            if not candidates:
+                continue
+            for clean_sig in candidates:
+                if raw_sig.name != clean_sig.name:
                     matches.append((raw_sig, clean_sig))
         return matches
 
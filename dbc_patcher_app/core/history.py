@@ -1,14 +1,14 @@
 """History logging utilities."""
 from __future__ import annotations
 
-import json
-from dataclasses import dataclass
-from datetime import datetime
+from dataclasses import asdict, dataclass
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, Iterator, List
 
+from .utils import json_dumps, json_loads, utc_now_stamp
 
-@dataclass
+
+@dataclass(slots=True)
 class HistoryEntry:
     timestamp: str
     action: str
@@ -16,25 +16,57 @@ class HistoryEntry:
 
 
 class HistoryLogger:
+    """Append-only history log stored as JSON lines (one entry per line)."""
+
     def __init__(self, path: Path) -> None:
         self.path = path
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._migrate_legacy()
         if not self.path.exists():
-            self.path.parent.mkdir(parents=True, exist_ok=True)
-            self.path.write_text("[]", encoding="utf-8")
+            self.path.touch()
 
     def log(self, action: str, details: Dict[str, object]) -> None:
         entry = HistoryEntry(
-            timestamp=datetime.utcnow().strftime("%Y-%m-%d %H:%M:%S"),
+            timestamp=utc_now_stamp(),
             action=action,
             details=details,
         )
-        data = self._load()
-        data.append(entry.__dict__)
-        self.path.write_text(json.dumps(data, indent=2), encoding="utf-8")
+        with self.path.open("a", buffering=8192, encoding="utf-8") as f:
+            f.write(json_dumps(asdict(entry), indent=False) + "\n")
 
-    def _load(self) -> List[Dict[str, object]]:
-        return json.loads(self.path.read_text(encoding="utf-8"))
+    def iter_entries(self) -> Iterator[Dict[str, object]]:
+        with self.path.open("rb") as f:
+            for line in f:
+                if line.strip():
+                    yield json_loads(line)
 
     def entries(self) -> List[Dict[str, object]]:
-        return self._load()
+        return list(self.iter_entries())
+
+    def _migrate_legacy(self) -> None:
+        """Convert an old JSON-array history file to JSON lines, once."""
+
+        source = self.path
+        if not source.exists():
+            legacy = self.path.with_suffix(".json")
+            if legacy == self.path or not legacy.exists():
+                return
+            source = legacy
+        if not _is_json_array(source):
+            return
+        data = json_loads(source.read_bytes())
+        lines = "".join(json_dumps(entry, indent=False) + "\n" for entry in data)
+        self.path.write_text(lines, encoding="utf-8")
+
+
+def _is_json_array(path: Path) -> bool:
+    """Return True if the first non-whitespace byte of ``path`` is ``[``."""
 
+    with path.open("rb") as f:
+        while True:
+            chunk = f.read(4096)
+            if not chunk:
+                return False
+            chunk = chunk.lstrip()
+            if chunk:
+                return chunk[:1] == b"["
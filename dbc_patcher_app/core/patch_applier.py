@@ -1,11 +1,9 @@
 """Patch application logic for DBC models."""
 from __future__ import annotations
 
-from copy import deepcopy
 from dataclasses import dataclass
-from typing import Dict, List, Tuple
-
-from cantools.database.can import Message
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Tuple
+import operator
 
 from .dbc_parser import (
     DBCModel,
@@ -14,11 +12,49 @@ from .dbc_parser import (
     DBCParser,
     build_database_from_dict,
 )
-from .merge_utils import insert_message_into_database
 from .ref_db import ReferenceDB
 
+if TYPE_CHECKING:
+    from cantools.database.can import Message
+
+# Same order as DBCParser gives signals on load.
+_signal_order = operator.attrgetter("start_bit", "length", "name")
+
+
+@dataclass(slots=True)
+class ParsedRule:
+    """Patch rule with its optional keys resolved once, before dispatch."""
+
+    raw: Dict[str, object]
+    op: Optional[str]
+    message_id: Optional[str]
+    signal_match: Optional[Dict[str, int]]
+    signal_name: Optional[str]
+    signal: Optional[Dict[str, object]]
+    message: Optional[Dict[str, object]]
+    changes: Dict[str, Dict[str, object]]
+    name: Optional[str]
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, object]) -> "ParsedRule":
+        get = data.get
+        return cls(
+            raw=data,
+            op=get("op"),
+            message_id=get("message_id"),
+            signal_match=get("signal_match"),
+            signal_name=get("signal_name"),
+            signal=get("signal"),
+            message=get("message"),
+            changes=get("changes") or {},
+            name=get("name"),
+        )
+
+
+_Handler = Callable[[DBCModel, ParsedRule], Tuple[str, Dict[str, object]]]
 
-@dataclass
+
+@dataclass(slots=True)
 class PatchResult:
     new_model: DBCModel
     applied: List[Dict[str, object]]
@@ -32,6 +68,17 @@ class PatchApplier:
     def __init__(self, parser: DBCParser, ref_db: ReferenceDB) -> None:
         self.parser = parser
         self.ref_db = ref_db
+        self._handlers: Dict[str, _Handler] = {
+            "update_signal": self._handle_update_signal,
+            "add_signal": self._handle_add_signal,
+            "add_signal_if_missing": self._handle_add_signal_if_missing,
+            "remove_signal": self._handle_remove_signal,
+            "rename_signal": self._handle_rename_signal,
+            "update_message_senders": self._handle_update_message_senders,
+            "add_message": self._handle_add_message,
+            "remove_message": self._handle_remove_message,
+            "update_message": self._handle_update_message,
+        }
 
     def apply_patch(self, model: DBCModel, patch: Dict[str, object]) -> PatchResult:
         applied: List[Dict[str, object]] = []
@@ -40,11 +87,11 @@ class PatchApplier:
 
         rules: List[Dict[str, object]] = patch.get("rules", [])  # type: ignore
 
-        for rule in rules:
-            op = rule.get("op")
-            handler = getattr(self, f"_handle_{op}", None)
+        handlers = self._handlers
+        for rule in map(ParsedRule.from_dict, rules):
+            handler = handlers.get(rule.op)
             if not handler:
-                skipped.append({"rule": rule, "reason": "unsupported"})
+                skipped.append({"rule": rule.raw, "reason": "unsupported"})
                 continue
             status, info = handler(model, rule)
             if status == "applied":
@@ -54,26 +101,28 @@ class PatchApplier:
             else:
                 skipped.append(info)
 
-        self.parser.update_database_from_model(model)
         return PatchResult(new_model=model, applied=applied, skipped=skipped, conflicts=conflicts)
 
     def _message_by_id(self, model: DBCModel, msg_hex: str) -> Tuple[str, DBCMessage | None]:
-        msg_id = int(msg_hex, 16)
-        return msg_hex, model.messages.get(msg_id)
-
-    def _find_signal_by_match(self, message: DBCMessage, match: Dict[str, int]) -> DBCSignal | None:
-        for sig in message.signals:
-            if sig.start_bit == match.get("start_bit") and sig.length == match.get("length"):
-                return sig
-        return None
-
-    def _refresh_model(self, model: DBCModel, database) -> None:
-        refreshed = self.parser._build_model_from_db(database, model.source_path)
-        model.db = refreshed.db
-        model.messages = refreshed.messages
-        model.version = refreshed.version
-        model.nodes = refreshed.nodes
-        model.loaded_at = refreshed.loaded_at
+        return msg_hex, model.messages.get(int(msg_hex, 16))
+
+    def _find_signal_by_match(
+        self, message: DBCMessage, match: Optional[Dict[str, int]]
+    ) -> DBCSignal | None:
+        if not match:
+            return None
+        return message.signals_by_key.get((match.get("start_bit"), match.get("length")))
+
+    def _insert_message(self, model: DBCModel, message: DBCMessage) -> None:
+        """Add or replace a message, keeping frame-id order, and mark it dirty."""
+
+        messages = model.messages
+        msg_id = message.message_id
+        needs_sort = msg_id not in messages and bool(messages) and msg_id < next(reversed(messages))
+        messages[msg_id] = message
+        if needs_sort:
+            model.messages = dict(sorted(messages.items()))
+        self.parser.update_database_from_model(model, (msg_id,))
 
     def _signal_from_dict(self, data: Dict[str, object]) -> DBCSignal:
         return DBCSignal(
@@ -98,46 +147,47 @@ class PatchApplier:
         temp_db = build_database_from_dict({"version": "", "nodes": [], "messages": [data]})
         return temp_db.messages[0]
 
-    def _handle_update_signal(self, model: DBCModel, rule: Dict[str, object]):
-        msg_hex, message = self._message_by_id(model, rule["message_id"])
+    def _handle_update_signal(self, model: DBCModel, rule: ParsedRule):
+        msg_hex, message = self._message_by_id(model, rule.message_id)
         if not message:
-            return "skipped", {"rule": rule, "reason": "message missing"}
-        match = rule.get("signal_match", {})
+            return "skipped", {"rule": rule.raw, "reason": "message missing"}
+        match = rule.signal_match
         signal = self._find_signal_by_match(message, match) if match else None
         if not signal:
-            return "skipped", {"rule": rule, "reason": "signal missing"}
+            return "skipped", {"rule": rule.raw, "reason": "signal missing"}
 
-        changes = rule.get("changes", {})
+        self.parser.update_database_from_model(model, (message.message_id,))
+        changes = rule.changes
         for field, change in changes.items():
             expected = change.get("from")
             new_val = change.get("to")
             current = getattr(signal, field, None)
             if expected is not None and current != expected:
                 return "conflict", {
-                    "rule": rule,
+                    "rule": rule.raw,
                     "reason": f"expected {expected} but found {current}",
                 }
             setattr(signal, field, new_val)
-        return "applied", {"rule": rule}
+        return "applied", {"rule": rule.raw}
 
-    def _handle_add_signal_if_missing(self, model: DBCModel, rule: Dict[str, object]):
+    def _handle_add_signal_if_missing(self, model: DBCModel, rule: ParsedRule):
         return self._handle_add_signal(model, rule)
 
-    def _handle_add_signal(self, model: DBCModel, rule: Dict[str, object]):
-        msg_hex, message = self._message_by_id(model, rule["message_id"])
+    def _handle_add_signal(self, model: DBCModel, rule: ParsedRule):
+        msg_hex, message = self._message_by_id(model, rule.message_id)
         if not message:
-            return "skipped", {"rule": rule, "reason": "message missing"}
-        sig_name = rule.get("signal_name")
+            return "skipped", {"rule": rule.raw, "reason": "message missing"}
+        sig_name = rule.signal_name
         if not sig_name:
-            return "skipped", {"rule": rule, "reason": "signal unspecified"}
-        if any(sig.name == sig_name for sig in message.signals):
-            return "skipped", {"rule": rule, "reason": "already exists"}
+            return "skipped", {"rule": rule.raw, "reason": "signal unspecified"}
+        if sig_name in message.signals_by_name:
+            return "skipped", {"rule": rule.raw, "reason": "already exists"}
 
         template = self.ref_db.suggest_for_signal(str(sig_name))
         if template:
-            new_signal = deepcopy(template)
-        elif rule.get("signal"):
-            new_signal = self._signal_from_dict(rule["signal"])
+            new_signal = template.clone()
+        elif rule.signal:
+            new_signal = self._signal_from_dict(rule.signal)
         else:
             new_signal = DBCSignal(
                 name=str(sig_name),
@@ -154,71 +204,73 @@ class PatchApplier:
                 value_table={},
             )
         message.signals.append(new_signal)
-        return "applied", {"rule": rule}
+        message.signals.sort(key=_signal_order)
+        self.parser.update_database_from_model(model, (message.message_id,))
+        return "applied", {"rule": rule.raw}
 
-    def _handle_remove_signal(self, model: DBCModel, rule: Dict[str, object]):
-        msg_hex, message = self._message_by_id(model, rule["message_id"])
+    def _handle_remove_signal(self, model: DBCModel, rule: ParsedRule):
+        msg_hex, message = self._message_by_id(model, rule.message_id)
         if not message:
-            return "skipped", {"rule": rule, "reason": "message missing"}
-        sig_name = rule.get("signal_name")
-        before = len(message.signals)
+            return "skipped", {"rule": rule.raw, "reason": "message missing"}
+        sig_name = rule.signal_name
+        if sig_name not in message.signals_by_name:
+            return "skipped", {"rule": rule.raw, "reason": "not found"}
         message.signals = [s for s in message.signals if s.name != sig_name]
-        if len(message.signals) == before:
-            return "skipped", {"rule": rule, "reason": "not found"}
-        return "applied", {"rule": rule}
+        self.parser.update_database_from_model(model, (message.message_id,))
+        return "applied", {"rule": rule.raw}
 
-    def _handle_rename_signal(self, model: DBCModel, rule: Dict[str, object]):
-        msg_hex, message = self._message_by_id(model, rule["message_id"])
+    def _handle_rename_signal(self, model: DBCModel, rule: ParsedRule):
+        msg_hex, message = self._message_by_id(model, rule.message_id)
         if not message:
-            return "skipped", {"rule": rule, "reason": "message missing"}
-        match = rule.get("signal_match", {})
+            return "skipped", {"rule": rule.raw, "reason": "message missing"}
+        match = rule.signal_match
         signal = self._find_signal_by_match(message, match)
         if not signal:
-            return "skipped", {"rule": rule, "reason": "signal missing"}
-        new_name = rule.get("signal_name")
+            return "skipped", {"rule": rule.raw, "reason": "signal missing"}
+        new_name = rule.signal_name
         if not new_name:
-            return "skipped", {"rule": rule, "reason": "new name missing"}
+            return "skipped", {"rule": rule.raw, "reason": "new name missing"}
         signal.name = str(new_name)
-        return "applied", {"rule": rule}
+        self.parser.update_database_from_model(model, (message.message_id,))
+        return "applied", {"rule": rule.raw}
 
-    def _handle_update_message_senders(self, model: DBCModel, rule: Dict[str, object]):
-        msg_hex, message = self._message_by_id(model, rule["message_id"])
+    def _handle_update_message_senders(self, model: DBCModel, rule: ParsedRule):
+        msg_hex, message = self._message_by_id(model, rule.message_id)
         if not message:
-            return "skipped", {"rule": rule, "reason": "message missing"}
+            return "skipped", {"rule": rule.raw, "reason": "message missing"}
 
-        changes = rule.get("changes", {})
+        changes = rule.changes
         change = changes.get("senders", {}) if isinstance(changes, dict) else {}
         expected = change.get("from")
         new_val = change.get("to")
         current = message.senders
 
         if expected is not None and current != expected:
-            return "conflict", {"rule": rule, "reason": f"expected {expected} but found {current}"}
+            return "conflict", {"rule": rule.raw, "reason": f"expected {expected} but found {current}"}
 
         message.senders = list(new_val or [])
-        return "applied", {"rule": rule}
+        self.parser.update_database_from_model(model, (message.message_id,))
+        return "applied", {"rule": rule.raw}
 
-    def _handle_add_message(self, model: DBCModel, rule: Dict[str, object]):
-        msg_hex = rule.get("message_id")
+    def _handle_add_message(self, model: DBCModel, rule: ParsedRule):
+        msg_hex = rule.message_id
         if not msg_hex:
-            return "skipped", {"rule": rule, "reason": "message id missing"}
+            return "skipped", {"rule": rule.raw, "reason": "message id missing"}
         msg_id = int(msg_hex, 16)
         if msg_id in model.messages:
-            return "skipped", {"rule": rule, "reason": "message exists"}
+            return "skipped", {"rule": rule.raw, "reason": "message exists"}
 
-        new_db = None
-        if rule.get("message"):
-            message_obj = self._cantools_message_from_dict(rule["message"])
-            new_db = insert_message_into_database(model.db, message_obj)
+        message_obj = None
+        if rule.message:
+            message_obj = self._cantools_message_from_dict(rule.message)
         else:
-            suggestion = self.ref_db.suggest_message(msg_id, rule.get("name") or "")
+            suggestion = self.ref_db.suggest_message(msg_id, rule.name or "")
             if suggestion:
                 message_obj = self._cantools_message_from_dict(self.parser._message_to_dict(suggestion))
-                new_db = insert_message_into_database(model.db, message_obj)
 
-        if new_db:
-            self._refresh_model(model, new_db)
-            return "applied", {"rule": rule}
+        if message_obj is not None:
+            self._insert_message(model, self.parser._message_from_cantools(message_obj))
+            return "applied", {"rule": rule.raw}
 
         new_message = DBCMessage(
             message_id=msg_id,
@@ -230,36 +282,37 @@ class PatchApplier:
             attributes={},
             signals=[],
         )
-        model.messages[msg_id] = new_message
-        return "applied", {"rule": rule}
+        self._insert_message(model, new_message)
+        return "applied", {"rule": rule.raw}
 
-    def _handle_remove_message(self, model: DBCModel, rule: Dict[str, object]):
-        msg_hex = rule.get("message_id")
+    def _handle_remove_message(self, model: DBCModel, rule: ParsedRule):
+        msg_hex = rule.message_id
         if not msg_hex:
-            return "skipped", {"rule": rule, "reason": "message id missing"}
+            return "skipped", {"rule": rule.raw, "reason": "message id missing"}
         msg_id = int(msg_hex, 16)
         if msg_id not in model.messages:
-            return "skipped", {"rule": rule, "reason": "not found"}
+            return "skipped", {"rule": rule.raw, "reason": "not found"}
         del model.messages[msg_id]
-        return "applied", {"rule": rule}
+        self.parser.update_database_from_model(model, (msg_id,))
+        return "applied", {"rule": rule.raw}
 
-    def _handle_update_message(self, model: DBCModel, rule: Dict[str, object]):
-        msg_hex = rule.get("message_id")
+    def _handle_update_message(self, model: DBCModel, rule: ParsedRule):
+        msg_hex = rule.message_id
         if not msg_hex:
-            return "skipped", {"rule": rule, "reason": "message id missing"}
+            return "skipped", {"rule": rule.raw, "reason": "message id missing"}
         msg_id = int(msg_hex, 16)
         if msg_id not in model.messages:
-            return "skipped", {"rule": rule, "reason": "message missing"}
-        message_data = rule.get("message")
+            return "skipped", {"rule": rule.raw, "reason": "message missing"}
+        message_data = rule.message
         if not message_data:
-            return "skipped", {"rule": rule, "reason": "no message payload"}
-
-        db_dict = self.parser.model_to_dict(model)
-        messages = db_dict.get("messages", [])
-        db_dict["messages"] = [
-            message_data if m.get("frame_id") == msg_id else m for m in messages
-        ]
-        new_db = build_database_from_dict(db_dict)
-        self._refresh_model(model, new_db)
-        return "applied", {"rule": rule}
+            return "skipped", {"rule": rule.raw, "reason": "no message payload"}
+
+        new_message = self.parser._message_from_cantools(
+            self._cantools_message_from_dict(message_data)
+        )
+        if new_message.message_id != msg_id:
+            del model.messages[msg_id]
+            self.parser.update_database_from_model(model, (msg_id,))
+        self._insert_message(model, new_message)
+        return "applied", {"rule": rule.raw}
 
@@ -1,13 +1,24 @@
 """Reference database for canonical signals and messages."""
 from __future__ import annotations
 
-import json
-from dataclasses import dataclass
+from dataclasses import dataclass, field, fields
+from operator import attrgetter
 from pathlib import Path
-from typing import Dict, Optional
-from copy import deepcopy
+from sys import intern
+from typing import Dict, Iterator, List, Optional, Tuple
 
 from .dbc_parser import DBCModel, DBCMessage, DBCSignal
+from .utils import json_loads, write_json
+
+# Serialized field names, resolved once instead of calling fields() per object.
+_SIGNAL_FIELDS = tuple(f.name for f in fields(DBCSignal))
+_signal_values = attrgetter(*_SIGNAL_FIELDS)
+_MESSAGE_FIELDS = tuple(
+    f.name for f in fields(DBCMessage) if f.init and f.name not in ("signals", "source")
+)
+_message_values = attrgetter(*_MESSAGE_FIELDS)
+
+_SearchIndex = Tuple[List[Tuple[str, DBCSignal]], List[Tuple[str, DBCMessage]]]
 
 
 @dataclass
@@ -15,55 +26,107 @@ class ReferenceDB:
     path: Path
     signals: Dict[str, DBCSignal]
     messages: Dict[str, DBCMessage]
+    # Message name -> ``messages`` key, so each message is stored only once.
+    name_index: Dict[str, str] = field(default_factory=dict)
+    # True when in-memory changes have not been written to ``path`` yet.
+    dirty: bool = field(default=False, init=False, repr=False, compare=False)
+    # (lowercased name, entry) pairs for search(), built on first use.
+    _search_index: Optional[_SearchIndex] = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     @classmethod
     def load_ref(cls, path: Path) -> "ReferenceDB":
         if not path.exists():
             path.parent.mkdir(parents=True, exist_ok=True)
-            path.write_text(json.dumps({"signals": {}, "messages": {}}), encoding="utf-8")
-        content = json.loads(path.read_text(encoding="utf-8"))
+            write_json(path, {"signals": {}, "messages": {}, "name_index": {}}, indent=False)
+        content = json_loads(path.read_bytes())
+        # Consume the parsed JSON as we go so each raw dict can be freed once
+        # its dataclass exists, instead of holding both copies at peak. Names
+        # are interned so keys and the names they duplicate share one string.
         signals = {
-            name: DBCSignal(**sig) for name, sig in content.get("signals", {}).items()
+            intern(name): DBCSignal(**_interned_name(sig))
+            for name, sig in _drain(content.pop("signals", {}))
         }
         messages = {
-            name: DBCMessage(**msg) for name, msg in content.get("messages", {}).items()
+            intern(key): DBCMessage(**_interned_message(msg))
+            for key, msg in _drain(content.pop("messages", {}))
         }
-        return cls(path=path, signals=signals, messages=messages)
+        name_index = content.pop("name_index", None)
+        if name_index is None:
+            name_index = _split_legacy_aliases(messages)
+        else:
+            name_index = {intern(name): intern(key) for name, key in name_index.items()}
+        return cls(path=path, signals=signals, messages=messages, name_index=name_index)
+
+    def save_ref(self, pretty: bool = False) -> None:
+        """Write the reference DB; compact by default, indented when ``pretty``."""
 
-    def save_ref(self) -> None:
         payload = {
-            "signals": {k: vars(v) for k, v in self.signals.items()},
+            "signals": {k: self._signal_to_dict(v) for k, v in self.signals.items()},
             "messages": {k: self._message_to_dict(v) for k, v in self.messages.items()},
+            "name_index": self.name_index,
         }
-        self.path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+        write_json(self.path, payload, indent=pretty)
+        self.dirty = False
+
+    def commit(self) -> None:
+        """Write pending changes, if any; imports only mark the DB dirty."""
+
+        if self.dirty:
+            self.save_ref()
+
+    def _signal_to_dict(self, sig: DBCSignal) -> Dict[str, object]:
+        return dict(zip(_SIGNAL_FIELDS, _signal_values(sig)))
 
     def _message_to_dict(self, msg: DBCMessage) -> Dict[str, object]:
-        data = vars(msg).copy()
-        data["signals"] = [vars(s) for s in msg.signals]
+        data = dict(zip(_MESSAGE_FIELDS, _message_values(msg)))
+        data["signals"] = [self._signal_to_dict(s) for s in msg.signals]
         return data
 
     def update_from_dbc(self, model: DBCModel) -> None:
         for msg in model.messages.values():
-            key = self._message_key(msg.message_id, msg.name)
+            key = intern(self._message_key(msg.message_id, msg.name))
             canonical = self._canonicalize_message(msg)
             self.messages[key] = canonical
-            self.messages[msg.name] = canonical
+            self.name_index[msg.name] = key
             for sig in msg.signals:
-                self.signals[sig.name] = deepcopy(sig)
-        self.save_ref()
+                self.signals[sig.name] = sig.clone()
+        self.dirty = True
+        self._search_index = None
+
+    def search(self, term: str) -> Tuple[List[DBCSignal], List[DBCMessage]]:
+        """Signals and messages whose lowercased name contains ``term``."""
+
+        index = self._search_index
+        if index is None:
+            index = self._search_index = (
+                [(s.name.lower(), s) for s in self.signals.values()],
+                [(m.name.lower(), m) for m in self.messages.values()],
+            )
+        term = term.lower()
+        signal_index, message_index = index
+        if not term:
+            return [s for _, s in signal_index], [m for _, m in message_index]
+        return (
+            [s for name, s in signal_index if term in name],
+            [m for name, m in message_index if term in name],
+        )
 
     def suggest_for_message(self, message: DBCMessage) -> Optional[DBCMessage]:
-        key = self._message_key(message.message_id, message.name)
-        return self.messages.get(key) or self.messages.get(message.name)
+        return self.suggest_message(message.message_id, message.name)
 
     def suggest_for_signal(self, signal_name: str) -> Optional[DBCSignal]:
         return self.signals.get(signal_name)
 
     def suggest_message(self, frame_id: int, name: str) -> Optional[DBCMessage]:
-        return self.messages.get(self._message_key(frame_id, name)) or self.messages.get(name)
+        messages = self.messages
+        return messages.get(self._message_key(frame_id, name)) or messages.get(
+            self.name_index.get(name, "")
+        )
 
     def _canonicalize_message(self, message: DBCMessage) -> DBCMessage:
-        cloned_signals = [deepcopy(sig) for sig in message.signals]
+        cloned_signals = [sig.clone() for sig in message.signals]
         return DBCMessage(
             message_id=message.message_id,
             name=message.name,
@@ -71,7 +134,7 @@ class ReferenceDB:
             cycle_time=message.cycle_time,
             comment=message.comment,
             is_extended_frame=message.is_extended_frame,
-            attributes=deepcopy(message.attributes),
+            attributes=dict(message.attributes),
             senders=list(message.senders),
             signals=cloned_signals,
         )
@@ -79,3 +142,36 @@ class ReferenceDB:
     def _message_key(self, frame_id: int, name: str) -> str:
         return f"{frame_id}:{name}"
 
+
+def _interned_name(data: Dict[str, object]) -> Dict[str, object]:
+    name = data.get("name")
+    if isinstance(name, str):
+        data["name"] = intern(name)
+    return data
+
+
+def _interned_message(data: Dict[str, object]) -> Dict[str, object]:
+    for sig in data.get("signals") or ():
+        if isinstance(sig, dict):
+            _interned_name(sig)
+    return _interned_name(data)
+
+
+def _split_legacy_aliases(messages: Dict[str, DBCMessage]) -> Dict[str, str]:
+    """Turn old name-keyed duplicate entries into a name index, in place."""
+
+    name_index: Dict[str, str] = {}
+    for key in [k for k in messages if ":" not in k]:
+        msg = messages[key]
+        canonical_key = f"{msg.message_id}:{msg.name}"
+        if canonical_key in messages:
+            del messages[key]
+            name_index[key] = canonical_key
+    return name_index
+
+
+def _drain(items: Dict[str, Dict[str, object]]) -> Iterator[Tuple[str, Dict[str, object]]]:
+    """Yield key/value pairs in file order, removing each from ``items``."""
+
+    for key in list(items):
+        yield key, items.pop(key)
@@ -2,15 +2,83 @@
 from __future__ import annotations
 
 import json
+import os
+import time
 from pathlib import Path
 from typing import Dict, Tuple
 
+try:  # Optional: a faster JSON encoder when installed.
+    import orjson
+except ImportError:
+    orjson = None
 
-def ensure_data_file(path: Path, default_content: object) -> None:
-    path.parent.mkdir(parents=True, exist_ok=True)
-    if not path.exists():
+
+def json_dumps(data: object, indent: bool = True) -> str:
+    """Serialize ``data`` to JSON text, using orjson when it is available."""
+
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+        return orjson.dumps(data, option=option).decode("utf-8")
+    if indent:
+        return json.dumps(data, indent=2)
+    return json.dumps(data, separators=(",", ":"))
+
+
+def write_json(path: Path, data: object, indent: bool = True) -> None:
+    """Write ``data`` as JSON to ``path``.
+
+    With orjson the encoded bytes are written in a single call.
+    """
+
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+        path.write_bytes(orjson.dumps(data, option=option))
+        return
+    # Stream the encoder's chunks through a large buffer rather than
+    # materializing the whole document as one string first.
+    with path.open("w", encoding="utf-8", buffering=1 << 20) as fp:
+        if indent:
+            json.dump(data, fp, indent=2)
+        else:
+            json.dump(data, fp, separators=(",", ":"))
+
+
+def json_loads(data: str | bytes) -> object:
+    """Parse JSON text or UTF-8 bytes, using orjson when it is available."""
+
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def utc_now_iso() -> str:
+    """Current UTC time as ``YYYY-MM-DDTHH:MM:SS.ffffff`` without datetime objects."""
+
+    ns = time.time_ns()
+    tm = time.gmtime(ns // 1_000_000_000)
+    return (
+        f"{tm.tm_year:04d}-{tm.tm_mon:02d}-{tm.tm_mday:02d}"
+        f"T{tm.tm_hour:02d}:{tm.tm_min:02d}:{tm.tm_sec:02d}.{ns // 1000 % 1_000_000:06d}"
+    )
+
+
+def utc_now_stamp() -> str:
+    """Current UTC time as ``YYYY-MM-DD HH:MM:SS`` (the history log format)."""
+
+    return time.strftime("%Y-%m-%d %H:%M:%S", time.gmtime())
+
+
+def ensure_data_file(path: Path, default_content: object, mkdir: bool = True) -> None:
+    """Create ``path`` with ``default_content`` unless it already exists.
+
+    Pass ``mkdir=False`` when the caller has already created the parent directory.
+    """
+
+    if mkdir:
+        path.parent.mkdir(parents=True, exist_ok=True)
+    if not os.path.exists(path):
         if isinstance(default_content, (dict, list)):
-            path.write_text(json.dumps(default_content, indent=2), encoding="utf-8")
+            write_json(path, default_content)
         else:
             path.write_text(str(default_content), encoding="utf-8")
 
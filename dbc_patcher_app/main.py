@@ -15,12 +15,12 @@ from .ui.main_window import MainWindow
 
 DATA_DIR = Path(__file__).resolve().parent / "data"
 REF_DB_PATH = DATA_DIR / "ref_db.json"
-HISTORY_PATH = DATA_DIR / "history.json"
+HISTORY_PATH = DATA_DIR / "history.jsonl"
 
 
 def bootstrap_files() -> None:
-    ensure_data_file(REF_DB_PATH, {"signals": {}, "messages": {}})
-    ensure_data_file(HISTORY_PATH, [])
+    DATA_DIR.mkdir(parents=True, exist_ok=True)
+    ensure_data_file(REF_DB_PATH, {"signals": {}, "messages": {}, "name_index": {}}, mkdir=False)
 
 
 def main() -> None:
@@ -31,6 +31,7 @@ def main() -> None:
     parser = DBCParser()
     ref_db = ReferenceDB.load_ref(REF_DB_PATH)
     history = HistoryLogger(HISTORY_PATH)
+    app.aboutToQuit.connect(ref_db.commit)
 
     window = MainWindow(parser=parser, ref_db=ref_db, history=history)
     window.show()
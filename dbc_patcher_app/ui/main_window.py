@@ -15,6 +15,7 @@ from .tabs.tab_direct_patch import DirectPatchTab
 from .tabs.tab_reference import ReferenceTab
 from .tabs.tab_history import HistoryTab
 from .tabs.tab_settings import SettingsTab
+from .widgets.lazy_tab import LazyTab, materialize_lazy_tab
 
 
 class MainWindow(QtWidgets.QMainWindow):
@@ -39,21 +40,27 @@ class MainWindow(QtWidgets.QMainWindow):
             GeneratePatchTab(parser=self.parser, ref_db=self.ref_db, history=self.history),
             "Generate Patch",
         )
+        # The remaining tabs are built the first time they are shown.
         tabs.addTab(
-            ApplyPatchTab(parser=self.parser, ref_db=self.ref_db, history=self.history),
+            LazyTab(
+                lambda: ApplyPatchTab(parser=self.parser, ref_db=self.ref_db, history=self.history)
+            ),
             "Apply Patch",
         )
         tabs.addTab(
-            DirectPatchTab(
-                parser=self.parser, ref_db=self.ref_db, history=self.history
+            LazyTab(
+                lambda: DirectPatchTab(
+                    parser=self.parser, ref_db=self.ref_db, history=self.history
+                )
             ),
             "3-File Patch (Direct Apply)",
         )
-        tabs.addTab(ReferenceTab(ref_db=self.ref_db), "Reference")
-        tabs.addTab(HistoryTab(history=self.history), "History")
+        tabs.addTab(LazyTab(lambda: ReferenceTab(ref_db=self.ref_db)), "Reference")
+        tabs.addTab(LazyTab(lambda: HistoryTab(history=self.history)), "History")
         tabs.addTab(
-            SettingsTab(ref_db=self.ref_db, history=self.history),
+            LazyTab(lambda: SettingsTab(ref_db=self.ref_db, history=self.history)),
             "Settings",
         )
+        tabs.currentChanged.connect(lambda index: materialize_lazy_tab(tabs, index))
         self.setCentralWidget(tabs)
 
@@ -1,16 +1,19 @@
 """Tab for applying patches to DBC files."""
 from __future__ import annotations
 
-import json
 from pathlib import Path
+from typing import Tuple
 
 from PyQt5 import QtWidgets
 
-from ...core.dbc_parser import DBCParser
-from ...core.patch_applier import PatchApplier
+from ...core.dbc_parser import DBCModel, DBCParser
+from ...core.patch_applier import PatchApplier, PatchResult
 from ...core.ref_db import ReferenceDB
 from ...core.history import HistoryLogger
+from ...core.utils import json_loads
 from ..widgets.file_selector import FileSelector
+from ..widgets.table_utils import fill_table, result_table
+from ..widgets.task_runner import run_background
 
 
 class ApplyPatchTab(QtWidgets.QWidget):
@@ -41,12 +44,9 @@ class ApplyPatchTab(QtWidgets.QWidget):
         self.apply_btn.clicked.connect(self._on_apply)
         layout.addWidget(self.apply_btn)
 
-        self.applied_table = QtWidgets.QTableWidget(0, 2)
-        self.applied_table.setHorizontalHeaderLabels(["Operation", "Target"])
-        self.skipped_table = QtWidgets.QTableWidget(0, 2)
-        self.skipped_table.setHorizontalHeaderLabels(["Operation", "Reason"])
-        self.conflicts_table = QtWidgets.QTableWidget(0, 2)
-        self.conflicts_table.setHorizontalHeaderLabels(["Conflict", "Detail"])
+        self.applied_table = result_table(("Operation", "Target"), ("rule",))
+        self.skipped_table = result_table(("Operation", "Reason"), ("reason",))
+        self.conflicts_table = result_table(("Conflict", "Detail"), ("reason",))
 
         layout.addWidget(QtWidgets.QLabel("Applied"))
         layout.addWidget(self.applied_table)
@@ -66,9 +66,23 @@ class ApplyPatchTab(QtWidgets.QWidget):
         if not raw_path.exists() or not patch_path.exists():
             QtWidgets.QMessageBox.warning(self, "Missing files", "Select both files")
             return
-        self.model = self.parser.load_dbc(raw_path)
-        patch_data = json.loads(patch_path.read_text(encoding="utf-8"))
-        self.result = self.applier.apply_patch(self.model, patch_data)
+        self.apply_btn.setEnabled(False)
+        run_background(
+            self._apply,
+            raw_path,
+            patch_path,
+            on_done=self._on_apply_done,
+            on_error=self._on_task_failed,
+        )
+
+    def _apply(self, raw_path: Path, patch_path: Path) -> Tuple[Path, Path, DBCModel, PatchResult]:
+        model = self.parser.load_dbc(raw_path)
+        patch_data = json_loads(patch_path.read_bytes())
+        return raw_path, patch_path, model, self.applier.apply_patch(model, patch_data)
+
+    def _on_apply_done(self, outcome: Tuple[Path, Path, DBCModel, PatchResult]) -> None:
+        raw_path, patch_path, self.model, self.result = outcome
+        self.apply_btn.setEnabled(True)
         self._populate_results()
         self.history.log(
             "apply_patch",
@@ -79,23 +93,16 @@ class ApplyPatchTab(QtWidgets.QWidget):
             },
         )
 
+    def _on_task_failed(self, exc: BaseException) -> None:
+        self.apply_btn.setEnabled(True)
+        QtWidgets.QMessageBox.critical(self, "Apply failed", str(exc))
+
     def _populate_results(self) -> None:
         if not self.result:
             return
-        self._fill_table(self.applied_table, self.result.applied, ["rule"])
-        self._fill_table(self.skipped_table, self.result.skipped, ["reason"])
-        self._fill_table(self.conflicts_table, self.result.conflicts, ["reason"])
-
-    def _fill_table(
-        self, table: QtWidgets.QTableWidget, data: list[dict], extra_fields: list[str]
-    ) -> None:
-        table.setRowCount(len(data))
-        for row, item in enumerate(data):
-            rule = item.get("rule", {})
-            table.setItem(row, 0, QtWidgets.QTableWidgetItem(str(rule.get("op"))))
-            details = ", ".join(f"{k}:{v}" for k, v in item.items() if k in extra_fields)
-            table.setItem(row, 1, QtWidgets.QTableWidgetItem(details))
-        table.resizeColumnsToContents()
+        fill_table(self.applied_table, self.result.applied)
+        fill_table(self.skipped_table, self.result.skipped)
+        fill_table(self.conflicts_table, self.result.conflicts)
 
     def _save_cleaned(self) -> None:
         if not self.model:
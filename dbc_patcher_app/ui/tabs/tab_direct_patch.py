@@ -1,8 +1,8 @@
 """Tab implementing the 3-file direct patch workflow."""
 from __future__ import annotations
 
-import json
-from typing import Dict, List, Optional
+from pathlib import Path
+from typing import Optional, Tuple
 
 from PyQt5 import QtCore, QtWidgets
 
@@ -11,7 +11,10 @@ from ...core.diff_engine import DiffEngine
 from ...core.patch_applier import PatchApplier, PatchResult
 from ...core.ref_db import ReferenceDB
 from ...core.history import HistoryLogger
+from ...core.utils import write_json
 from ..widgets.file_selector import FileSelector
+from ..widgets.table_utils import fill_table, result_table
+from ..widgets.task_runner import run_background
 
 
 class DirectPatchTab(QtWidgets.QWidget):
@@ -46,7 +49,7 @@ class DirectPatchTab(QtWidgets.QWidget):
 
         options_layout = QtWidgets.QHBoxLayout()
         self.export_patch_chk = QtWidgets.QCheckBox("Export patch file")
-        self.validate_chk = QtWidgets.QCheckBox("Validate output with cantools")
+        self.validate_chk = QtWidgets.QCheckBox("Validate output structure")
         self.patch_path_selector = FileSelector("Patch output (optional):", "JSON Files (*.json)", mode="save")
         self.patch_path_selector.setDisabled(True)
 
@@ -61,12 +64,9 @@ class DirectPatchTab(QtWidgets.QWidget):
         self.run_btn.clicked.connect(self._on_run)
         layout.addWidget(self.run_btn)
 
-        self.applied_table = QtWidgets.QTableWidget(0, 2)
-        self.applied_table.setHorizontalHeaderLabels(["Operation", "Target"])
-        self.skipped_table = QtWidgets.QTableWidget(0, 2)
-        self.skipped_table.setHorizontalHeaderLabels(["Operation", "Reason"])
-        self.conflicts_table = QtWidgets.QTableWidget(0, 2)
-        self.conflicts_table.setHorizontalHeaderLabels(["Conflict", "Detail"])
+        self.applied_table = result_table(("Operation", "Target"), ("rule",))
+        self.skipped_table = result_table(("Operation", "Reason"), ("reason",))
+        self.conflicts_table = result_table(("Conflict", "Detail"), ("reason",))
 
         layout.addWidget(QtWidgets.QLabel("Applied"))
         layout.addWidget(self.applied_table)
@@ -101,23 +101,52 @@ class DirectPatchTab(QtWidgets.QWidget):
             QtWidgets.QMessageBox.warning(self, "Missing files", "One or more input files do not exist.")
             return
 
+        patch_path = None
+        if self.export_patch_chk.isChecked() and self.patch_path_selector.is_set():
+            patch_path = self.patch_path_selector.path()
+
+        self.run_btn.setEnabled(False)
+        run_background(
+            self._do_direct_patch,
+            raw_old,
+            clean_old,
+            raw_new,
+            output_path,
+            self.validate_chk.isChecked(),
+            patch_path,
+            on_done=self._on_direct_patch_done,
+            on_error=self._on_task_failed,
+        )
+
+    def _do_direct_patch(
+        self,
+        raw_old: Path,
+        clean_old: Path,
+        raw_new: Path,
+        output_path: Path,
+        validate: bool,
+        patch_path: Optional[Path],
+    ) -> Tuple[Tuple[Path, Path, Path, Path], PatchResult]:
         raw_old_model = self.parser.load_dbc(raw_old)
         clean_old_model = self.parser.load_dbc(clean_old)
         raw_new_model = self.parser.load_dbc(raw_new)
 
         patch_obj = self.diff_engine.build_patch(raw_old_model, clean_old_model)
-        self.result = self.applier.apply_patch(raw_new_model, patch_obj)
+        result = self.applier.apply_patch(raw_new_model, patch_obj)
+        self.parser.save_dbc(result.new_model, output_path, validate=validate)
 
-        validate = self.validate_chk.isChecked()
-        self.parser.save_dbc(self.result.new_model, output_path, validate=validate)
+        if patch_path is not None:
+            patch_path.parent.mkdir(parents=True, exist_ok=True)
+            write_json(patch_path, patch_obj)
+        return (raw_old, clean_old, raw_new, output_path), result
 
-        if self.export_patch_chk.isChecked():
-            if not self.patch_path_selector.is_set():
-                QtWidgets.QMessageBox.warning(self, "Patch path", "Select a path to export the patch file.")
-            else:
-                patch_path = self.patch_path_selector.path()
-                patch_path.parent.mkdir(parents=True, exist_ok=True)
-                patch_path.write_text(json.dumps(patch_obj, indent=2), encoding="utf-8")
+    def _on_direct_patch_done(
+        self, outcome: Tuple[Tuple[Path, Path, Path, Path], PatchResult]
+    ) -> None:
+        (raw_old, clean_old, raw_new, output_path), self.result = outcome
+        self.run_btn.setEnabled(True)
+        if self.export_patch_chk.isChecked() and not self.patch_path_selector.is_set():
+            QtWidgets.QMessageBox.warning(self, "Patch path", "Select a path to export the patch file.")
 
         self._populate_results()
         self.history.log(
@@ -131,20 +160,13 @@ class DirectPatchTab(QtWidgets.QWidget):
             },
         )
 
+    def _on_task_failed(self, exc: BaseException) -> None:
+        self.run_btn.setEnabled(True)
+        QtWidgets.QMessageBox.critical(self, "Direct patch failed", str(exc))
+
     def _populate_results(self) -> None:
         if not self.result:
             return
-        self._fill_table(self.applied_table, self.result.applied, ["rule"])
-        self._fill_table(self.skipped_table, self.result.skipped, ["reason"])
-        self._fill_table(self.conflicts_table, self.result.conflicts, ["reason"])
-
-    def _fill_table(
-        self, table: QtWidgets.QTableWidget, data: List[Dict[str, object]], extra_fields: List[str]
-    ) -> None:
-        table.setRowCount(len(data))
-        for row, item in enumerate(data):
-            rule = item.get("rule", {})
-            table.setItem(row, 0, QtWidgets.QTableWidgetItem(str(rule.get("op"))))
-            details = ", ".join(f"{k}:{v}" for k, v in item.items() if k in extra_fields)
-            table.setItem(row, 1, QtWidgets.QTableWidgetItem(details))
-        table.resizeColumnsToContents()
+        fill_table(self.applied_table, self.result.applied)
+        fill_table(self.skipped_table, self.result.skipped)
+        fill_table(self.conflicts_table, self.result.conflicts)
@@ -1,9 +1,8 @@
 """Tab for generating DBC patches."""
 from __future__ import annotations
 
-import json
 from pathlib import Path
-from typing import List
+from typing import Dict, Tuple
 
 from PyQt5 import QtWidgets
 
@@ -11,9 +10,10 @@ from ...core.diff_engine import DiffEngine
 from ...core.dbc_parser import DBCParser
 from ...core.ref_db import ReferenceDB
 from ...core.history import HistoryLogger
-from ...core.utils import diff_summary
+from ...core.utils import write_json
 from ..widgets.file_selector import FileSelector
 from ..widgets.diff_preview_table import DiffPreviewTable
+from ..widgets.task_runner import run_background
 
 
 class GeneratePatchTab(QtWidgets.QWidget):
@@ -57,26 +57,33 @@ class GeneratePatchTab(QtWidgets.QWidget):
         if not raw_path.exists() or not clean_path.exists():
             QtWidgets.QMessageBox.warning(self, "Missing files", "Please select both DBC files.")
             return
+        self.generate_btn.setEnabled(False)
+        run_background(
+            self._generate,
+            raw_path,
+            clean_path,
+            on_done=self._on_generate_done,
+            on_error=self._on_task_failed,
+        )
+
+    def _generate(self, raw_path: Path, clean_path: Path) -> Tuple[Path, Path, Dict[str, object]]:
         raw_model = self.parser.load_dbc(raw_path)
         clean_model = self.parser.load_dbc(clean_path)
-        self.patch_data = self.diff_engine.generate_patch(raw_model, clean_model)
-        rows = [
-            {
-                "field": summary[0],
-                "old": "",
-                "new": summary[1],
-                "type": rule.get("op"),
-                "status": "modified",
-            }
-            for rule in self.patch_data["rules"]
-            for summary in [diff_summary(rule)]
-        ]
-        self.diff_table.load_diffs(rows)
+        return raw_path, clean_path, self.diff_engine.generate_patch(raw_model, clean_model)
+
+    def _on_generate_done(self, outcome: Tuple[Path, Path, Dict[str, object]]) -> None:
+        raw_path, clean_path, self.patch_data = outcome
+        self.generate_btn.setEnabled(True)
+        self.diff_table.load_rules(self.patch_data["rules"])
         self.history.log(
             "generate_patch",
             {"raw": str(raw_path), "clean": str(clean_path), "rules": len(self.patch_data["rules"])}
         )
 
+    def _on_task_failed(self, exc: BaseException) -> None:
+        self.generate_btn.setEnabled(True)
+        QtWidgets.QMessageBox.critical(self, "Generate failed", str(exc))
+
     def _save_patch(self) -> None:
         if not self.patch_data:
             QtWidgets.QMessageBox.information(self, "No patch", "Generate a patch first.")
@@ -86,6 +93,6 @@ class GeneratePatchTab(QtWidgets.QWidget):
         )
         if not path:
             return
-        Path(path).write_text(json.dumps(self.patch_data, indent=2), encoding="utf-8")
+        write_json(Path(path), self.patch_data)
         QtWidgets.QMessageBox.information(self, "Saved", f"Patch saved to {path}")
 
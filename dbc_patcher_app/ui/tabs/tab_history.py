@@ -3,10 +3,33 @@ from __future__ import annotations
 
 import csv
 from pathlib import Path
+from typing import Dict, Iterable
 
 from PyQt5 import QtWidgets
 
 from ...core.history import HistoryLogger
+from ...core.utils import json_dumps
+from ..widgets.dict_list_model import DictListModel
+from ..widgets.task_runner import run_background
+
+
+def _input_files(entry: Dict[str, object]) -> str:
+    details = entry.get("details", {})
+    return ", ".join(str(v) for k, v in details.items() if "file" in k or k in {"raw", "clean"})
+
+
+def _conflicts(entry: Dict[str, object]) -> object:
+    details = entry.get("details", {})
+    return details.get("conflicts", details.get("conflicts_count", ""))
+
+
+_HISTORY_COLUMNS = [
+    ("Timestamp", lambda entry: entry.get("timestamp", "")),
+    ("Action", lambda entry: entry.get("action", "")),
+    ("Input", _input_files),
+    ("Conflicts", _conflicts),
+    ("Output", lambda entry: entry.get("details", {}).get("output", "")),
+]
 
 
 class HistoryTab(QtWidgets.QWidget):
@@ -17,10 +40,8 @@ class HistoryTab(QtWidgets.QWidget):
 
     def _init_ui(self) -> None:
         layout = QtWidgets.QVBoxLayout(self)
-        self.table = QtWidgets.QTableWidget(0, 5)
-        self.table.setHorizontalHeaderLabels(
-            ["Timestamp", "Action", "Input", "Conflicts", "Output"]
-        )
+        self.table = QtWidgets.QTableView()
+        self.table.setModel(DictListModel(_HISTORY_COLUMNS, parent=self.table))
         self.export_btn = QtWidgets.QPushButton("Export CSV")
         self.export_btn.clicked.connect(self._export_csv)
         layout.addWidget(self.table)
@@ -29,29 +50,44 @@ class HistoryTab(QtWidgets.QWidget):
         self._refresh()
 
     def _refresh(self) -> None:
-        entries = self.history.entries()
-        self.table.setRowCount(len(entries))
-        for row, entry in enumerate(entries):
-            details = entry.get("details", {})
-            self.table.setItem(row, 0, QtWidgets.QTableWidgetItem(entry.get("timestamp", "")))
-            self.table.setItem(row, 1, QtWidgets.QTableWidgetItem(entry.get("action", "")))
-            input_files = ", ".join(str(v) for k, v in details.items() if "file" in k or k in {"raw", "clean"})
-            self.table.setItem(row, 2, QtWidgets.QTableWidgetItem(input_files))
-            conflicts = str(details.get("conflicts", details.get("conflicts_count", "")))
-            self.table.setItem(row, 3, QtWidgets.QTableWidgetItem(conflicts))
-            output = str(details.get("output", ""))
-            self.table.setItem(row, 4, QtWidgets.QTableWidgetItem(output))
+        self.table.model().set_rows(self.history.entries())
         self.table.resizeColumnsToContents()
 
     def _export_csv(self) -> None:
         path, _ = QtWidgets.QFileDialog.getSaveFileName(self, "Export history", "history.csv", "CSV (*.csv)")
         if not path:
             return
-        entries = self.history.entries()
-        with Path(path).open("w", newline="", encoding="utf-8") as f:
-            writer = csv.writer(f)
-            writer.writerow(["timestamp", "action", "details"])
-            for entry in entries:
-                writer.writerow([entry.get("timestamp"), entry.get("action"), entry.get("details")])
+        self.export_btn.setEnabled(False)
+        # Read the entries here: the worker must not hold the log file open
+        # while this thread may append to it.
+        run_background(
+            _write_history_csv,
+            Path(path),
+            self.history.entries(),
+            on_done=self._on_export_done,
+            on_error=self._on_export_failed,
+        )
+
+    def _on_export_done(self, path: Path) -> None:
+        self.export_btn.setEnabled(True)
         QtWidgets.QMessageBox.information(self, "Exported", f"History saved to {path}")
 
+    def _on_export_failed(self, exc: BaseException) -> None:
+        self.export_btn.setEnabled(True)
+        QtWidgets.QMessageBox.critical(self, "Export failed", str(exc))
+
+
+def _write_history_csv(path: Path, entries: Iterable[Dict[str, object]]) -> Path:
+    with path.open("w", newline="", encoding="utf-8", buffering=1 << 20) as f:
+        writer = csv.writer(f)
+        writer.writerow(["timestamp", "action", "details"])
+        writer.writerows(
+            (
+                entry.get("timestamp"),
+                entry.get("action"),
+                json_dumps(entry.get("details", {}), indent=False),
+            )
+            for entry in entries
+        )
+    return path
+
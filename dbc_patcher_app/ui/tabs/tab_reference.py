@@ -1,13 +1,15 @@
 """Reference database viewer tab."""
 from __future__ import annotations
 
+import shutil
 from pathlib import Path
 
-from PyQt5 import QtWidgets
+from PyQt5 import QtCore, QtWidgets
 
 from ...core.ref_db import ReferenceDB
 from ...core.dbc_parser import DBCParser
 from ..widgets.file_selector import FileSelector
+from ..widgets.table_utils import batched_updates
 
 
 class ReferenceTab(QtWidgets.QWidget):
@@ -33,7 +35,12 @@ class ReferenceTab(QtWidgets.QWidget):
 
         self.search_box = QtWidgets.QLineEdit()
         self.search_box.setPlaceholderText("Search signal or message")
-        self.search_box.textChanged.connect(self._refresh_tables)
+        # Debounce typing so the tables are refiltered once per pause.
+        self._search_timer = QtCore.QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.setInterval(150)
+        self._search_timer.timeout.connect(self._refresh_tables)
+        self.search_box.textChanged.connect(self._search_timer.start)
 
         layout.addWidget(self.import_selector)
         layout.addWidget(self.import_btn)
@@ -53,6 +60,7 @@ class ReferenceTab(QtWidgets.QWidget):
             QtWidgets.QMessageBox.warning(self, "File missing", "Select a DBC file")
             return
         model = self.parser.load_dbc(path)
+        # Only marks the reference dirty; it is written on export and on quit.
         self.ref_db.update_from_dbc(model)
         self._refresh_tables()
         QtWidgets.QMessageBox.information(self, "Imported", "Reference updated")
@@ -63,24 +71,21 @@ class ReferenceTab(QtWidgets.QWidget):
         )
         if not path:
             return
-        self.ref_db.save_ref()
-        dest = Path(path)
-        dest.write_text(Path(self.ref_db.path).read_text(encoding="utf-8"), encoding="utf-8")
+        self.ref_db.commit()
+        shutil.copyfile(self.ref_db.path, Path(path))
         QtWidgets.QMessageBox.information(self, "Exported", f"Reference saved to {path}")
 
     def _refresh_tables(self) -> None:
-        term = self.search_box.text().lower()
-        signals = [s for s in self.ref_db.signals.values() if term in s.name.lower()]
-        self.signal_table.setRowCount(len(signals))
-        for row, sig in enumerate(signals):
-            self.signal_table.setItem(row, 0, QtWidgets.QTableWidgetItem(sig.name))
-            self.signal_table.setItem(row, 1, QtWidgets.QTableWidgetItem(str(sig.start_bit)))
-            self.signal_table.setItem(row, 2, QtWidgets.QTableWidgetItem(str(sig.length)))
-        messages = [m for m in self.ref_db.messages.values() if term in m.name.lower()]
-        self.message_table.setRowCount(len(messages))
-        for row, msg in enumerate(messages):
-            self.message_table.setItem(row, 0, QtWidgets.QTableWidgetItem(msg.name))
-            self.message_table.setItem(row, 1, QtWidgets.QTableWidgetItem(msg.hex_id))
-        self.signal_table.resizeColumnsToContents()
-        self.message_table.resizeColumnsToContents()
+        signals, messages = self.ref_db.search(self.search_box.text())
+        with batched_updates(self.signal_table) as table:
+            table.setRowCount(len(signals))
+            for row, sig in enumerate(signals):
+                table.setItem(row, 0, QtWidgets.QTableWidgetItem(sig.name))
+                table.setItem(row, 1, QtWidgets.QTableWidgetItem(str(sig.start_bit)))
+                table.setItem(row, 2, QtWidgets.QTableWidgetItem(str(sig.length)))
+        with batched_updates(self.message_table) as table:
+            table.setRowCount(len(messages))
+            for row, msg in enumerate(messages):
+                table.setItem(row, 0, QtWidgets.QTableWidgetItem(msg.name))
+                table.setItem(row, 1, QtWidgets.QTableWidgetItem(msg.hex_id))
 
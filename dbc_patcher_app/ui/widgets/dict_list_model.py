@@ -0,0 +1,53 @@
+"""Read-only table model over a list of dictionaries."""
+from __future__ import annotations
+
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+from PyQt5 import QtCore
+
+Column = Tuple[str, Callable[[Dict[str, object]], object]]
+
+
+class DictListModel(QtCore.QAbstractTableModel):
+    """Expose ``rows`` to a QTableView; cells are formatted only when painted.
+
+    Each column is a ``(header, getter)`` pair where ``getter`` maps a row
+    dictionary to the value shown in that column.
+    """
+
+    def __init__(
+        self,
+        columns: Sequence[Column],
+        rows: Optional[List[Dict[str, object]]] = None,
+        parent: Optional[QtCore.QObject] = None,
+    ) -> None:
+        super().__init__(parent)
+        self._columns = list(columns)
+        self._rows: List[Dict[str, object]] = rows if rows is not None else []
+
+    def set_rows(self, rows: List[Dict[str, object]]) -> None:
+        self.beginResetModel()
+        self._rows = rows
+        self.endResetModel()
+
+    def rows(self) -> List[Dict[str, object]]:
+        return self._rows
+
+    def rowCount(self, parent: QtCore.QModelIndex = QtCore.QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent: QtCore.QModelIndex = QtCore.QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._columns)
+
+    def data(self, index: QtCore.QModelIndex, role: int = QtCore.Qt.DisplayRole):
+        if role != QtCore.Qt.DisplayRole or not index.isValid():
+            return None
+        getter = self._columns[index.column()][1]
+        return str(getter(self._rows[index.row()]))
+
+    def headerData(
+        self, section: int, orientation: QtCore.Qt.Orientation, role: int = QtCore.Qt.DisplayRole
+    ):
+        if role == QtCore.Qt.DisplayRole and orientation == QtCore.Qt.Horizontal:
+            return self._columns[section][0]
+        return super().headerData(section, orientation, role)
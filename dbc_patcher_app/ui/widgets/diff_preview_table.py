@@ -1,30 +1,104 @@
-"""Table widget to display diff previews."""
+"""Table view to display diff previews."""
 from __future__ import annotations
 
-from typing import List, Dict
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
 
-from PyQt5 import QtWidgets, QtGui
+from PyQt5 import QtCore, QtGui, QtWidgets
 
+from ...core.utils import diff_summary
+from .table_utils import batched_updates
+
+# (field, old, new, type, status) for one preview row.
+_PreviewRow = Tuple[object, object, object, object, object]
+
+
+class DiffModel(QtCore.QAbstractTableModel):
+    """Preview rows kept as the caller's list; cells are produced on demand."""
 
-class DiffPreviewTable(QtWidgets.QTableWidget):
     HEADERS = ["Field", "Old", "New", "Type"]
+    _STATUS_BRUSH = {
+        "added": QtGui.QBrush(QtGui.QColor("#d4edda")),
+        "removed": QtGui.QBrush(QtGui.QColor("#f8d7da")),
+        "modified": QtGui.QBrush(QtGui.QColor("#fff3cd")),
+    }
+
+    def __init__(self, parent: Optional[QtCore.QObject] = None) -> None:
+        super().__init__(parent)
+        self._rows: Sequence[object] = []
+        self._row_values: Callable[[object], _PreviewRow] = _diff_row
+        # Views paint a row's cells back to back; keep that row's values.
+        self._cached_row = -1
+        self._cached_values: _PreviewRow = ("", "", "", "", None)
+
+    def set_rows(self, rows: Sequence[object], row_values: Callable[[object], _PreviewRow]) -> None:
+        self.beginResetModel()
+        self._rows = rows
+        self._row_values = row_values
+        self._cached_row = -1
+        self.endResetModel()
+
+    def _values(self, row: int) -> _PreviewRow:
+        if row != self._cached_row:
+            self._cached_values = self._row_values(self._rows[row])
+            self._cached_row = row
+        return self._cached_values
+
+    def rowCount(self, parent: QtCore.QModelIndex = QtCore.QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent: QtCore.QModelIndex = QtCore.QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def data(self, index: QtCore.QModelIndex, role: int = QtCore.Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        if role == QtCore.Qt.DisplayRole:
+            value = self._values(index.row())[index.column()]
+            return value if type(value) is str else str(value)
+        if role == QtCore.Qt.BackgroundRole:
+            return self._STATUS_BRUSH.get(self._values(index.row())[4])
+        return None
+
+    def headerData(
+        self, section: int, orientation: QtCore.Qt.Orientation, role: int = QtCore.Qt.DisplayRole
+    ):
+        if role == QtCore.Qt.DisplayRole and orientation == QtCore.Qt.Horizontal:
+            return self.HEADERS[section]
+        return super().headerData(section, orientation, role)
+
+
+class DiffPreviewTable(QtWidgets.QTableView):
+    HEADERS = DiffModel.HEADERS
 
     def __init__(self, parent=None):
-        super().__init__(0, len(self.HEADERS), parent)
-        self.setHorizontalHeaderLabels(self.HEADERS)
+        super().__init__(parent)
+        self.setModel(DiffModel(self))
         self.horizontalHeader().setStretchLastSection(True)
 
+    def sizeHintForColumn(self, column: int) -> int:
+        """Size a column from its first row only, keeping resizes O(1) in the row count."""
+
+        model = self.model()
+        if not model.rowCount():
+            return -1
+        return self.sizeHintForIndex(model.index(0, column)).width()
+
     def load_diffs(self, rows: List[Dict[str, str]]) -> None:
-        self.setRowCount(len(rows))
-        for row_idx, row in enumerate(rows):
-            for col_idx, key in enumerate(["field", "old", "new", "type"]):
-                item = QtWidgets.QTableWidgetItem(str(row.get(key, "")))
-                if row.get("status") == "added":
-                    item.setBackground(QtGui.QColor("#d4edda"))
-                elif row.get("status") == "removed":
-                    item.setBackground(QtGui.QColor("#f8d7da"))
-                elif row.get("status") == "modified":
-                    item.setBackground(QtGui.QColor("#fff3cd"))
-                self.setItem(row_idx, col_idx, item)
-        self.resizeColumnsToContents()
+        with batched_updates(self):
+            self.model().set_rows(rows, _diff_row)
+
+    def load_rules(self, rules: List[Dict[str, object]]) -> None:
+        """Preview patch rules directly, without building intermediate row dicts."""
+
+        with batched_updates(self):
+            self.model().set_rows(rules, _rule_row)
+
+
+def _diff_row(row: Dict[str, str]) -> _PreviewRow:
+    get = row.get
+    return get("field", ""), get("old", ""), get("new", ""), get("type", ""), get("status")
+
 
+def _rule_row(rule: Dict[str, object]) -> _PreviewRow:
+    field, target = diff_summary(rule)
+    return field, "", target, rule.get("op"), "modified"
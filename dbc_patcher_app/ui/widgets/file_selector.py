@@ -18,6 +18,9 @@ class FileSelector(QtWidgets.QWidget):
         super().__init__(parent)
         self.filter = filter
         self.mode = mode
+        self._cached_path: Optional[Path] = None
+        self._is_set = False
+        self._last_dir = ""
         self._init_ui(label)
 
     def _init_ui(self, label: str) -> None:
@@ -26,6 +29,7 @@ class FileSelector(QtWidgets.QWidget):
 
         self.label = QtWidgets.QLabel(label)
         self.path_edit = QtWidgets.QLineEdit()
+        self.path_edit.textChanged.connect(self._on_text_changed)
         self.browse_btn = QtWidgets.QPushButton("Browse")
         self.browse_btn.clicked.connect(self._browse)
 
@@ -34,17 +38,22 @@ class FileSelector(QtWidgets.QWidget):
         layout.addWidget(self.browse_btn)
 
     def _browse(self) -> None:
-        dialog = QtWidgets.QFileDialog(self)
-        dialog.setNameFilter(self.filter)
         if self.mode == "save":
-            path, _ = dialog.getSaveFileName(self, "Save file", "", self.filter)
+            path, _ = QtWidgets.QFileDialog.getSaveFileName(self, "Save file", self._last_dir, self.filter)
         else:
-            path, _ = dialog.getOpenFileName(self, "Select file", "", self.filter)
+            path, _ = QtWidgets.QFileDialog.getOpenFileName(self, "Select file", self._last_dir, self.filter)
         if path:
+            self._last_dir = str(Path(path).parent)
             self.path_edit.setText(path)
 
+    def _on_text_changed(self, text: str) -> None:
+        self._cached_path = None
+        self._is_set = bool(text.strip())
+
     def path(self) -> Path:
-        return Path(self.path_edit.text())
+        if self._cached_path is None:
+            self._cached_path = Path(self.path_edit.text())
+        return self._cached_path
 
     def set_path(self, path: Path) -> None:
         self.path_edit.setText(str(path))
@@ -53,5 +62,5 @@ class FileSelector(QtWidgets.QWidget):
         return self.path().exists()
 
     def is_set(self) -> bool:
-        return bool(self.path_edit.text().strip())
+        return self._is_set
 
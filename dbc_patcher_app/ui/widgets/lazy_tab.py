@@ -0,0 +1,36 @@
+"""Placeholder tab that builds its real widget on first activation."""
+from __future__ import annotations
+
+from typing import Callable, Optional
+
+from PyQt5 import QtWidgets
+
+
+class LazyTab(QtWidgets.QWidget):
+    """Empty stand-in holding a ``factory`` for the tab it replaces."""
+
+    def __init__(
+        self,
+        factory: Callable[[], QtWidgets.QWidget],
+        parent: Optional[QtWidgets.QWidget] = None,
+    ) -> None:
+        super().__init__(parent)
+        self.factory = factory
+
+
+def materialize_lazy_tab(tabs: QtWidgets.QTabWidget, index: int) -> None:
+    """Replace the LazyTab at ``index`` (if any) with the widget it builds."""
+
+    placeholder = tabs.widget(index)
+    if not isinstance(placeholder, LazyTab):
+        return
+    widget = placeholder.factory()
+    label = tabs.tabText(index)
+    blocked = tabs.blockSignals(True)
+    try:
+        tabs.removeTab(index)
+        tabs.insertTab(index, widget, label)
+        tabs.setCurrentIndex(index)
+    finally:
+        tabs.blockSignals(blocked)
+    placeholder.deleteLater()
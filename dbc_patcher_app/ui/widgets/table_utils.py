@@ -0,0 +1,51 @@
+"""Helpers for filling table views efficiently."""
+from __future__ import annotations
+
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Tuple
+
+from PyQt5 import QtWidgets
+
+from .dict_list_model import DictListModel
+
+
+@contextmanager
+def batched_updates(table: QtWidgets.QTableView) -> Iterator[QtWidgets.QTableView]:
+    """Suspend repaints, sorting and signals while many cells or rows are written.
+
+    Columns are resized to their contents once, after the batch.
+    """
+
+    sorting = table.isSortingEnabled()
+    table.setUpdatesEnabled(False)
+    table.setSortingEnabled(False)
+    blocked = table.blockSignals(True)
+    try:
+        yield table
+    finally:
+        table.blockSignals(blocked)
+        table.setSortingEnabled(sorting)
+        table.resizeColumnsToContents()
+        table.setUpdatesEnabled(True)
+
+
+def result_table(headers: Tuple[str, str], extra_fields: Tuple[str, ...]) -> QtWidgets.QTableView:
+    """Table listing patch results: the rule's op, then ``extra_fields`` as ``key:value``."""
+
+    def details(item: Dict[str, object]) -> str:
+        return ", ".join(f"{k}:{item[k]}" for k in extra_fields if k in item)
+
+    columns = [
+        (headers[0], lambda item: item.get("rule", {}).get("op")),
+        (headers[1], details),
+    ]
+    table = QtWidgets.QTableView()
+    table.setModel(DictListModel(columns, parent=table))
+    return table
+
+
+def fill_table(table: QtWidgets.QTableView, rows: List[Dict[str, object]]) -> None:
+    """Show ``rows`` in a table made by ``result_table``."""
+
+    table.model().set_rows(rows)
+    table.resizeColumnsToContents()
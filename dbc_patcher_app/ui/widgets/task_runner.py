@@ -0,0 +1,54 @@
+"""Run slow core operations on the Qt thread pool."""
+from __future__ import annotations
+
+from typing import Any, Callable, Optional, Set
+
+from PyQt5 import QtCore
+
+
+class _TaskSignals(QtCore.QObject):
+    finished = QtCore.pyqtSignal(object)
+    failed = QtCore.pyqtSignal(object)
+
+
+class _Task(QtCore.QRunnable):
+    def __init__(self, fn: Callable[..., Any], args: tuple) -> None:
+        super().__init__()
+        self.fn = fn
+        self.args = args
+        self.signals = _TaskSignals()
+
+    def run(self) -> None:
+        try:
+            result = self.fn(*self.args)
+        except Exception as exc:  # reported to the UI thread via ``failed``
+            self.signals.failed.emit(exc)
+        else:
+            self.signals.finished.emit(result)
+
+
+# Signal objects of running tasks, kept alive until their result is delivered.
+_ACTIVE: Set[_TaskSignals] = set()
+
+
+def run_background(
+    fn: Callable[..., Any],
+    *args: Any,
+    on_done: Callable[[Any], None],
+    on_error: Optional[Callable[[BaseException], None]] = None,
+) -> None:
+    """Call ``fn(*args)`` on the global thread pool.
+
+    ``on_done`` receives the return value and ``on_error`` any exception; both
+    are invoked on the thread that called ``run_background`` (the UI thread).
+    """
+
+    task = _Task(fn, args)
+    signals = task.signals
+    _ACTIVE.add(signals)
+    signals.finished.connect(on_done)
+    if on_error is not None:
+        signals.failed.connect(on_error)
+    signals.finished.connect(lambda _: _ACTIVE.discard(signals))
+    signals.failed.connect(lambda _: _ACTIVE.discard(signals))
+    QtCore.QThreadPool.globalInstance().start(task)
@@ -0,0 +1,59 @@
+"""Shared sample data and helpers for the test suite."""
+from __future__ import annotations
+
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from dbc_patcher_app.core.dbc_parser import DBCParser
+
+SAMPLE_DBC = """VERSION "1.0"
+
+NS_ :
+
+BS_:
+
+BU_: ECU1 ECU2
+
+BO_ 256 MSG_A: 8 ECU1
+ SG_ SigA1 : 0|8@1+ (1,0) [0|255] "km/h" ECU2
+ SG_ SigA2 : 8|16@1- (0.1,-5) [-100|100] "" ECU2
+
+BO_ 512 MSG_B: 8 ECU2
+ SG_ SigB1 : 0|4@1+ (1,0) [0|15] "" ECU1
+
+CM_ SG_ 256 SigA1 "speed";
+VAL_ 512 SigB1 0 "Off" 1 "On" ;
+"""
+
+# A third message, inserted before the comments of SAMPLE_DBC.
+EXTRA_MESSAGE = """BO_ 768 MSG_C: 4 ECU1
+ SG_ SigC1 : 0|8@1+ (1,0) [0|255] "" ECU2
+
+"""
+
+
+def write_sample_dbc(directory: Path, name: str = "sample.dbc", extra: bool = False) -> Path:
+    text = SAMPLE_DBC.replace("CM_ ", EXTRA_MESSAGE + "CM_ ", 1) if extra else SAMPLE_DBC
+    path = Path(directory) / name
+    path.write_text(text, encoding="utf-8")
+    return path
+
+
+class CacheTestCase(unittest.TestCase):
+    """Runs each test with an empty load cache and default cache settings."""
+
+    def setUp(self) -> None:
+        DBCParser.clear_cache()
+        self.addCleanup(DBCParser.clear_cache)
+        env = mock.patch.dict(os.environ)
+        env.start()
+        self.addCleanup(env.stop)
+        for name in ("DBC_PATCHER_CACHE", "DBC_PATCHER_CACHE_SIZE", "DBC_PATCHER_CACHE_DIR"):
+            os.environ.pop(name, None)
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.dir = Path(self.tmp.name)
+        self.parser = DBCParser()
@@ -0,0 +1,47 @@
+"""Tests for the opt-in on-disk DBC cache."""
+from __future__ import annotations
+
+import os
+import pickle
+import unittest
+from unittest import mock
+
+from dbc_patcher_app.core import dbc_parser
+from dbc_patcher_app.core.dbc_parser import DBCParser
+
+from ._fixtures import CacheTestCase, write_sample_dbc
+
+
+class DiskCacheTests(CacheTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.cache_dir = self.dir / "cache"
+        os.environ["DBC_PATCHER_CACHE_DIR"] = str(self.cache_dir)
+
+    def test_later_session_skips_parsing(self) -> None:
+        path = write_sample_dbc(self.dir)
+        self.parser.load_dbc(path)
+        self.assertEqual(len(list(self.cache_dir.glob("*.pkl"))), 1)
+        DBCParser.clear_cache()
+        with mock.patch.object(dbc_parser.cantools.database, "load_file") as load_file:
+            model = self.parser.load_dbc(path)
+        load_file.assert_not_called()
+        self.assertEqual(model.messages[0x200].signals[0].value_table, {"0": "Off", "1": "On"})
+
+    def test_stale_entry_is_ignored(self) -> None:
+        path = write_sample_dbc(self.dir)
+        self.parser.load_dbc(path)
+        DBCParser.clear_cache()
+        write_sample_dbc(self.dir, extra=True)
+        self.assertIn(0x300, self.parser.load_dbc(path).messages)
+
+    def test_failed_write_leaves_no_temp_file(self) -> None:
+        path = write_sample_dbc(self.dir)
+        with mock.patch.object(dbc_parser.pickle, "dump", side_effect=pickle.PicklingError):
+            model = self.parser.load_dbc(path)
+        self.assertEqual(sorted(model.messages), [0x100, 0x200])
+        self.assertEqual(list(self.cache_dir.iterdir()), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,46 @@
+"""Tests for the JSON-lines history log."""
+from __future__ import annotations
+
+import json
+import tempfile
+import unittest
+from pathlib import Path
+
+from dbc_patcher_app.core.history import HistoryLogger
+
+
+class HistoryLoggerTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.dir = Path(self.tmp.name)
+
+    def test_log_appends_lines(self) -> None:
+        logger = HistoryLogger(self.dir / "history.jsonl")
+        logger.log("generate", {"n": 1})
+        logger.log("apply", {"n": 2})
+        entries = logger.entries()
+        self.assertEqual([e["action"] for e in entries], ["generate", "apply"])
+        self.assertEqual(len((self.dir / "history.jsonl").read_text().splitlines()), 2)
+
+    def test_migrates_array_in_place(self) -> None:
+        path = self.dir / "history.jsonl"
+        legacy = [{"timestamp": "t", "action": "a", "details": {}}]
+        path.write_text("\n  " + json.dumps(legacy), encoding="utf-8")
+        self.assertEqual(HistoryLogger(path).entries(), legacy)
+
+    def test_migrates_sibling_json(self) -> None:
+        legacy = [{"timestamp": "t", "action": "a", "details": {}}]
+        (self.dir / "history.json").write_text(json.dumps(legacy), encoding="utf-8")
+        self.assertEqual(HistoryLogger(self.dir / "history.jsonl").entries(), legacy)
+
+    def test_existing_lines_left_alone(self) -> None:
+        path = self.dir / "history.jsonl"
+        content = '{"timestamp": "t", "action": "a", "details": {"x": [1]}}\n'
+        path.write_text(content, encoding="utf-8")
+        HistoryLogger(path)
+        self.assertEqual(path.read_text(encoding="utf-8"), content)
+
+
+if __name__ == "__main__":
+    unittest.main()
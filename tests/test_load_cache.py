@@ -0,0 +1,51 @@
+"""Tests for the in-memory DBC load cache."""
+from __future__ import annotations
+
+import os
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from dbc_patcher_app.core import dbc_parser
+
+from ._fixtures import CacheTestCase, write_sample_dbc
+
+
+class LoadCacheTests(CacheTestCase):
+    def test_repeated_load_returns_independent_copies(self) -> None:
+        path = write_sample_dbc(self.dir)
+        first = self.parser.load_dbc(path)
+        first.messages[0x100].signals[0].name = "Edited"
+        del first.messages[0x200]
+        with mock.patch.object(dbc_parser.cantools.database, "load_file") as load_file:
+            second = self.parser.load_dbc(path)
+        load_file.assert_not_called()
+        self.assertEqual(sorted(second.messages), [0x100, 0x200])
+        self.assertEqual(second.messages[0x100].signals[0].name, "SigA1")
+
+    def test_changed_file_is_reparsed(self) -> None:
+        path = write_sample_dbc(self.dir)
+        self.parser.load_dbc(path)
+        write_sample_dbc(self.dir, extra=True)
+        self.assertEqual(sorted(self.parser.load_dbc(path).messages), [0x100, 0x200, 0x300])
+        self.assertEqual(len(dbc_parser._LOAD_CACHE), 1)
+
+    def test_least_recently_used_entry_is_evicted(self) -> None:
+        paths = [write_sample_dbc(self.dir, f"{name}.dbc") for name in "abc"]
+        with mock.patch.dict(os.environ, {"DBC_PATCHER_CACHE_SIZE": "2"}):
+            self.parser.load_dbc(paths[0])
+            self.parser.load_dbc(paths[1])
+            self.parser.load_dbc(paths[0])
+            self.parser.load_dbc(paths[2])
+        cached = {Path(key[0]).name for key in dbc_parser._LOAD_CACHE}
+        self.assertEqual(cached, {"a.dbc", "c.dbc"})
+
+    def test_cache_can_be_disabled(self) -> None:
+        path = write_sample_dbc(self.dir)
+        with mock.patch.dict(os.environ, {"DBC_PATCHER_CACHE": "0"}):
+            self.parser.load_dbc(path)
+        self.assertEqual(len(dbc_parser._LOAD_CACHE), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
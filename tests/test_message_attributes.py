@@ -0,0 +1,67 @@
+"""Tests for reading message attributes from cantools objects."""
+from __future__ import annotations
+
+import copy
+import json
+import pickle
+import tempfile
+import unittest
+from pathlib import Path
+
+from dbc_patcher_app.core import dbc_parser
+from dbc_patcher_app.core.dbc_parser import DBCParser
+
+from ._fixtures import write_sample_dbc
+
+
+class MessageAttributeTests(unittest.TestCase):
+    def setUp(self) -> None:
+        dbc_parser._ATTR_FETCHERS.clear()
+        self.parser = DBCParser()
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.model = self.parser.load_dbc(write_sample_dbc(Path(self.tmp.name)))
+
+    def _built_message(self):
+        # Messages built from a dict carry ``attributes`` on the instance.
+        message = copy.copy(self.model.db.get_message_by_frame_id(0x100))
+        message.attributes = {"GenMsgCycleTime": "100"}
+        return message
+
+    def _plain_message(self):
+        return self.model.db.get_message_by_frame_id(0x200)
+
+    def test_built_message_attributes_survive_plain_probe(self) -> None:
+        self.assertEqual(self.parser._extract_message_attributes(self._plain_message()), {})
+        self.assertEqual(
+            self.parser._extract_message_attributes(self._built_message()),
+            {"GenMsgCycleTime": "100"},
+        )
+
+    def test_plain_message_after_built_probe(self) -> None:
+        self.assertEqual(
+            self.parser._extract_message_attributes(self._built_message()),
+            {"GenMsgCycleTime": "100"},
+        )
+        self.assertEqual(self.parser._extract_message_attributes(self._plain_message()), {})
+
+    def test_shared_attributes_are_read_only(self) -> None:
+        first = self.parser._extract_message_attributes(self._built_message())
+        second = self.parser._extract_message_attributes(self._built_message())
+        self.assertIs(first, second)
+        with self.assertRaises(TypeError):
+            first["GenMsgCycleTime"] = "10"  # type: ignore[index]
+
+        message = self.model.messages[0x100]
+        message.attributes = first
+        self.assertIs(message.clone().attributes, first)
+        data = self.parser._message_to_dict(message)
+        self.assertEqual(json.loads(json.dumps(data))["attributes"], {"GenMsgCycleTime": "100"})
+        self.assertEqual(pickle.loads(pickle.dumps(message)).attributes, first)
+
+        DBCParser.clear_cache()
+        self.assertEqual(dbc_parser._ATTR_FLYWEIGHT, {})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,237 @@
+"""Tests for applying patch rules to a DBC model."""
+from __future__ import annotations
+
+import json
+import tempfile
+import unittest
+from pathlib import Path
+
+from dbc_patcher_app.core.dbc_parser import DBCParser
+from dbc_patcher_app.core.patch_applier import ParsedRule, PatchApplier
+from dbc_patcher_app.core.ref_db import ReferenceDB
+
+from ._fixtures import write_sample_dbc
+
+NEW_MESSAGE = {
+    "frame_id": 0x300,
+    "name": "MSG_C",
+    "length": 4,
+    "senders": ["ECU1"],
+    "attributes": {"GenMsgCycleTime": "50"},
+    "signals": [{"name": "SigC1", "start_bit": 0, "length": 8}],
+}
+
+
+class ParsedRuleTests(unittest.TestCase):
+    def test_missing_keys_default(self) -> None:
+        raw = {"op": "remove_message", "message_id": "0x100"}
+        rule = ParsedRule.from_dict(raw)
+        self.assertIs(rule.raw, raw)
+        self.assertEqual((rule.op, rule.message_id), ("remove_message", "0x100"))
+        self.assertIsNone(rule.signal_match)
+        self.assertEqual(rule.changes, {})
+
+
+class ApplyPatchTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        directory = self.dir = Path(self.tmp.name)
+        self.parser = DBCParser()
+        self.model = self.parser.load_dbc(write_sample_dbc(directory))
+        self.applier = PatchApplier(self.parser, ReferenceDB.load_ref(directory / "ref.json"))
+
+    def apply(self, *rules):
+        result = self.applier.apply_patch(self.model, {"rules": list(rules)})
+        # Every outcome is logged to history, so it must stay JSON-serializable.
+        json.dumps([result.applied, result.skipped, result.conflicts])
+        return result
+
+    def assert_applied(self, rule) -> None:
+        result = self.apply(rule)
+        self.assertEqual(result.applied, [{"rule": rule}])
+        self.assertEqual((result.skipped, result.conflicts), ([], []))
+
+    def assert_skipped(self, rule, reason: str) -> None:
+        result = self.apply(rule)
+        self.assertEqual(result.skipped, [{"rule": rule, "reason": reason}])
+        self.assertEqual((result.applied, result.conflicts), ([], []))
+
+    def save_and_reload(self):
+        """Save the patched model with validation and load it back."""
+
+        out = self.dir / "patched.dbc"
+        self.parser.save_dbc(self.model, out)
+        return self.parser.load_dbc(out)
+
+    def signal(self, msg_id: int, name: str):
+        return self.model.messages[msg_id].signals_by_name.get(name)
+
+    def test_unsupported_op_is_skipped(self) -> None:
+        self.assert_skipped({"op": "explode", "message_id": "0x100"}, "unsupported")
+        self.assert_skipped({"message_id": "0x100"}, "unsupported")
+
+    def test_update_signal(self) -> None:
+        rule = {
+            "op": "update_signal",
+            "message_id": "0x100",
+            "signal_match": {"start_bit": 0, "length": 8},
+            "changes": {"unit": {"from": "km/h", "to": "kph"}},
+        }
+        self.assert_applied(rule)
+        self.assertEqual(self.signal(0x100, "SigA1").unit, "kph")
+
+    def test_update_signal_conflict(self) -> None:
+        rule = {
+            "op": "update_signal",
+            "message_id": "0x100",
+            "signal_match": {"start_bit": 0, "length": 8},
+            "changes": {"unit": {"from": "mph", "to": "kph"}},
+        }
+        result = self.apply(rule)
+        self.assertEqual(len(result.conflicts), 1)
+        self.assertIs(result.conflicts[0]["rule"], rule)
+        self.assertEqual(self.signal(0x100, "SigA1").unit, "km/h")
+
+    def test_update_signal_skips(self) -> None:
+        match = {"start_bit": 40, "length": 8}
+        self.assert_skipped(
+            {"op": "update_signal", "message_id": "0x999", "signal_match": match},
+            "message missing",
+        )
+        self.assert_skipped(
+            {"op": "update_signal", "message_id": "0x100", "signal_match": match},
+            "signal missing",
+        )
+
+    def test_add_signal(self) -> None:
+        rule = {
+            "op": "add_signal",
+            "message_id": "0x100",
+            "signal_name": "SigNew",
+            "signal": {"name": "SigNew", "start_bit": 24, "length": 8},
+        }
+        self.assert_applied(rule)
+        self.assertEqual(self.signal(0x100, "SigNew").start_bit, 24)
+        saved = self.save_and_reload().messages[0x100]
+        self.assertEqual([sig.name for sig in saved.signals], ["SigA1", "SigA2", "SigNew"])
+        self.assert_skipped(rule, "already exists")
+        self.assert_skipped({"op": "add_signal", "message_id": "0x100"}, "signal unspecified")
+
+    def test_add_signal_keeps_start_bit_order(self) -> None:
+        self.assert_applied(
+            {
+                "op": "add_signal",
+                "message_id": "0x200",
+                "signal_name": "SigHigh",
+                "signal": {"name": "SigHigh", "start_bit": 8, "length": 8},
+            }
+        )
+        self.assert_applied(
+            {
+                "op": "add_signal",
+                "message_id": "0x200",
+                "signal_name": "SigLow",
+                "signal": {"name": "SigLow", "start_bit": 4, "length": 4},
+            }
+        )
+        names = [sig.name for sig in self.model.messages[0x200].signals]
+        self.assertEqual(names, ["SigB1", "SigLow", "SigHigh"])
+
+    def test_model_db_follows_edits(self) -> None:
+        self.assertEqual(
+            [sig.name for sig in self.model.db.get_message_by_frame_id(0x200).signals], ["SigB1"]
+        )
+        self.assert_applied(
+            {
+                "op": "add_signal",
+                "message_id": "0x200",
+                "signal_name": "SigB2",
+                "signal": {"name": "SigB2", "start_bit": 8, "length": 8},
+            }
+        )
+        rebuilt = self.model.db
+        self.assertIs(self.model.db, rebuilt)
+        message = rebuilt.get_message_by_frame_id(0x200)
+        self.assertEqual([sig.name for sig in message.signals], ["SigB1", "SigB2"])
+
+    def test_add_signal_if_missing(self) -> None:
+        rule = {"op": "add_signal_if_missing", "message_id": "0x200", "signal_name": "SigB2"}
+        self.assert_applied(rule)
+        self.assertIsNotNone(self.signal(0x200, "SigB2"))
+
+    def test_remove_signal(self) -> None:
+        rule = {"op": "remove_signal", "message_id": "0x100", "signal_name": "SigA2"}
+        self.assert_applied(rule)
+        self.assertIsNone(self.signal(0x100, "SigA2"))
+        self.assert_skipped(rule, "not found")
+
+    def test_rename_signal(self) -> None:
+        match = {"start_bit": 8, "length": 16}
+        rule = {
+            "op": "rename_signal",
+            "message_id": "0x100",
+            "signal_match": match,
+            "signal_name": "Renamed",
+        }
+        self.assert_applied(rule)
+        self.assertIsNotNone(self.signal(0x100, "Renamed"))
+        self.assert_skipped(
+            {"op": "rename_signal", "message_id": "0x100", "signal_match": match},
+            "new name missing",
+        )
+
+    def test_update_message_senders(self) -> None:
+        rule = {
+            "op": "update_message_senders",
+            "message_id": "0x100",
+            "changes": {"senders": {"from": ["ECU1"], "to": ["ECU2"]}},
+        }
+        self.assert_applied(rule)
+        senders = self.model.messages[0x100].senders
+        self.assertEqual(senders, ["ECU2"])
+        self.assertIsNot(senders, rule["changes"]["senders"]["to"])
+        result = self.apply(rule)
+        self.assertEqual(result.conflicts[0]["rule"], rule)
+
+    def test_add_message(self) -> None:
+        rule = {"op": "add_message", "message_id": "0x300", "message": NEW_MESSAGE}
+        self.assert_applied(rule)
+        self.assertEqual(list(self.model.messages), [0x100, 0x200, 0x300])
+        added = self.model.messages[0x300]
+        self.assertEqual(added.attributes, {"GenMsgCycleTime": "50"})
+        self.assertEqual([sig.name for sig in added.signals], ["SigC1"])
+        saved = self.save_and_reload().messages[0x300]
+        self.assertEqual((saved.name, saved.length, saved.senders), ("MSG_C", 4, ["ECU1"]))
+        self.assertEqual([sig.name for sig in saved.signals], ["SigC1"])
+        self.assert_skipped(rule, "message exists")
+        self.assert_skipped({"op": "add_message"}, "message id missing")
+
+    def test_add_message_keeps_frame_id_order(self) -> None:
+        self.assert_applied({"op": "add_message", "message_id": "0x10"})
+        self.assertEqual(list(self.model.messages), [0x10, 0x100, 0x200])
+        self.assertEqual(self.model.messages[0x10].name, "MSG_0x10")
+
+    def test_remove_message(self) -> None:
+        rule = {"op": "remove_message", "message_id": "0x200"}
+        self.assert_applied(rule)
+        self.assertEqual(list(self.model.messages), [0x100])
+        self.assert_skipped(rule, "not found")
+
+    def test_update_message(self) -> None:
+        payload = dict(NEW_MESSAGE, frame_id=0x200, name="MSG_B2")
+        rule = {"op": "update_message", "message_id": "0x200", "message": payload}
+        self.assert_applied(rule)
+        self.assertEqual(self.model.messages[0x200].name, "MSG_B2")
+        saved = self.save_and_reload()
+        self.assertEqual(list(saved.messages), [0x100, 0x200])
+        self.assertEqual(saved.messages[0x200].name, "MSG_B2")
+        self.assertEqual([sig.name for sig in saved.messages[0x200].signals], ["SigC1"])
+        self.assert_skipped({"op": "update_message", "message_id": "0x200"}, "no message payload")
+        self.assert_skipped(
+            {"op": "update_message", "message_id": "0x999", "message": payload}, "message missing"
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,89 @@
+"""Tests for writing models back to DBC files."""
+from __future__ import annotations
+
+import tempfile
+import unittest
+from pathlib import Path
+
+from dbc_patcher_app.core.dbc_parser import DBCParser, DBCSignal
+
+from ._fixtures import write_sample_dbc
+
+MULTIPLEXED_DBC = """VERSION ""
+
+NS_ :
+
+BS_:
+
+BU_: ECU1 ECU2
+
+BO_ 768 MSG_MUX: 8 ECU1
+ SG_ Mux M : 0|8@1+ (1,0) [0|255] "" ECU2
+ SG_ Sub0 m0 : 8|16@1+ (1,0) [0|0] "" ECU2
+ SG_ Sub1 m1 : 8|8@1+ (1,0) [0|0] "" ECU2
+"""
+
+
+class SaveDbcTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.dir = Path(self.tmp.name)
+        self.parser = DBCParser()
+        self.model = self.parser.load_dbc(write_sample_dbc(self.dir))
+
+    def test_round_trip(self) -> None:
+        out = self.dir / "out.dbc"
+        self.parser.save_dbc(self.model, out)
+        saved = self.parser.load_dbc(out)
+        self.assertEqual(list(saved.messages), [0x100, 0x200])
+        self.assertEqual(
+            [sig.name for sig in saved.messages[0x100].signals], ["SigA1", "SigA2"]
+        )
+        self.assertEqual(saved.messages[0x200].signals[0].value_table, {"0": "Off", "1": "On"})
+
+    def test_multiplexed_round_trip(self) -> None:
+        path = self.dir / "mux.dbc"
+        path.write_text(MULTIPLEXED_DBC, encoding="utf-8")
+        out = self.dir / "out.dbc"
+        for validate in (True, False):
+            with self.subTest(validate=validate):
+                self.parser.save_dbc(self.parser.load_dbc(path), out, validate=validate)
+                signals = self.parser.load_dbc(out).messages[0x300].signals
+                self.assertEqual(
+                    [(sig.name, sig.multiplex, sig.multiplexer_ids) for sig in signals],
+                    [("Mux", "MUX", None), ("Sub1", "SUB", [1]), ("Sub0", "SUB", [0])],
+                )
+
+    def test_invalid_name_is_rejected_by_default(self) -> None:
+        self.model.messages[0x100].signals[0].name = "Sig A1"
+        out = self.dir / "out.dbc"
+        with self.assertRaises(ValueError):
+            self.parser.save_dbc(self.model, out)
+        self.assertFalse(out.exists())
+
+    def test_overlapping_signals_are_rejected(self) -> None:
+        message = self.model.messages[0x200]
+        message.signals.append(
+            DBCSignal(
+                name="SigB2",
+                start_bit=2,
+                length=4,
+                byte_order="intel",
+                is_signed=False,
+                scale=1.0,
+                offset=0.0,
+                minimum=None,
+                maximum=None,
+                unit=None,
+                comment=None,
+                value_table={},
+            )
+        )
+        for validate in (True, False):
+            with self.subTest(validate=validate), self.assertRaises(Exception):
+                self.parser.save_dbc(self.model, self.dir / "out.dbc", validate=validate)
+
+
+if __name__ == "__main__":
+    unittest.main()